@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.routers import extraction, upload, config, status
+from app.utils.text import ensure_punkt
 
 logging.basicConfig(
     level=logging.INFO,
@@ -57,6 +58,8 @@ def root():
 @app.on_event("startup")
 def startup_event():
     """Application startup handler"""
+    if not ensure_punkt():
+        logger.warning("NLTK punkt data unavailable; using regex sentence splitting")
     logger.info(" FastAPI application started")
 
 
@@ -63,8 +63,9 @@ async def upload_csv(
         enriched_rows = []
         for row in rows:
             text = row.get("text", "")
-            sentences = TextProcessor.split_sentences(text)
-            sentence_offsets = TextProcessor.get_sentence_offsets(text, sentences)
+            spans = TextProcessor.split_with_offsets(text)
+            sentences = [sentence for sentence, _, _ in spans]
+            sentence_offsets = [(start, end) for _, start, end in spans]
 
             enriched_rows.append({
                 **row,
@@ -138,8 +139,9 @@ async def upload_pdf(
             raw_text = PDFService.extract_text(pdf_content)
             text = PDFService.clean_pdf_text(raw_text)
 
-            sentences = TextProcessor.split_sentences(text)
-            sentence_offsets = TextProcessor.get_sentence_offsets(text, sentences)
+            spans = TextProcessor.split_with_offsets(text)
+            sentences = [sentence for sentence, _, _ in spans]
+            sentence_offsets = [(start, end) for _, start, end in spans]
 
             # Use filename (without extension) as ID
             pdf_id = Path(file.filename).stem
@@ -1,17 +1,16 @@
 from operator import truediv
 import os
-import json
+import orjson
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime, timezone
 from pydantic import BaseModel
 
-class PydanticEncoder(json.JSONEncoder):
-    """Custom JSON encoder for Pydantic models"""
-    def default(self, obj):
-        if isinstance(obj, BaseModel):
-            return obj.model_dump()
-        return super().default(obj)
+def _pydantic_default(obj):
+    """orjson fallback serializer for Pydantic models"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 class DataStorageService:
     
@@ -24,37 +23,35 @@ class DataStorageService:
         job_dir.mkdir(parents=True, exist_ok=True)
 
         rows_file = job_dir / "rows.json"
-        with open(rows_file, "w") as f:
-            json.dump(rows, f)
+        with open(rows_file, "wb") as f:
+            f.write(orjson.dumps(rows, option=orjson.OPT_NON_STR_KEYS))
         return True
     
     @staticmethod
     def get_job_rows(job_id: str) -> List[Dict[str, str]]:
         rows_file = DataStorageService.STORAGE_DIR / job_id / "rows.json"
-        if not rows_file.exists():
+        try:
+            with open(rows_file, "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
             return []
 
-        with open(rows_file, "r") as f:
-            return json.load(f)
-
     @staticmethod
     def store_job_results(job_id: str, results: List[Dict]) -> bool:
         job_dir = DataStorageService.STORAGE_DIR / job_id
         results_file = job_dir / "results.json"
 
-        with open(results_file, "w") as f:
-            json.dump(results, f, indent=2, cls=PydanticEncoder)
+        with open(results_file, "wb") as f:
+            f.write(orjson.dumps(results, default=_pydantic_default, option=orjson.OPT_NON_STR_KEYS))
         return True
 
     @staticmethod
     def get_job_results(job_id: str) -> List[Dict]:
         results_file = DataStorageService.STORAGE_DIR / job_id / "results.json"
-        if not results_file.exists():
-            return []
         try:
-            with open(results_file, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
+            with open(results_file, "rb") as f:
+                return orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return []
 
     @staticmethod
@@ -11,10 +11,50 @@ from app.services.extraction_service import ExtractionService
 
 logger = logging.getLogger(__name__)
 
+class JobState:
+    """
+    In-memory state of one extraction job.
+    
+    Uses __slots__ so progress updates are plain attribute stores.
+    Subscript and get() access are kept for callers that treat jobs as dicts.
+    """
+
+    __slots__ = (
+        "job_id", "status", "created_at", "started_at", "completed_at",
+        "total_rows", "processed_rows", "current_row", "progress_percent",
+        "categories", "provider", "model", "results", "errors",
+    )
+
+    def __init__(self, job_id: str, total_rows: int, provider: str, model: str):
+        self.job_id = job_id
+        self.status = ExtractionStatus.PENDING
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at = None
+        self.completed_at = None
+        self.total_rows = total_rows
+        self.processed_rows = 0
+        self.current_row = None
+        self.progress_percent = 0.0
+        self.categories = []
+        self.provider = provider
+        self.model = model
+        self.results = []
+        self.errors = []
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+
 class JobManager:
     """In memory job manager (temporary)"""
 
-    _jobs: Dict[str, Dict] = {}
+    _jobs: Dict[str, JobState] = {}
 
     @staticmethod
     def create_job(categories: List[CategoryField],
@@ -25,29 +65,17 @@ class JobManager:
         
         job_id = str(uuid.uuid4())
 
-        job = {
-            "job_id": job_id,
-            "status": ExtractionStatus.PENDING,
-            "created_at": datetime.now(timezone.utc),
-            "started_at": None,
-            "completed_at": None,
-            "total_rows": rows,
-            "processed_rows": 0,
-            "current_row": None,
-            "progress_percent": 0.0,
-            "categories": [],
-            "provider": provider,
-            "model": model,
-            "results": [],
-            "errors": []
-        }
-
-        JobManager._jobs[job_id] = job
+        JobManager._jobs[job_id] = JobState(
+            job_id=job_id,
+            total_rows=rows,
+            provider=provider,
+            model=model
+        )
         logger.info(f"Created job {job_id}")
         return job_id
 
     @staticmethod
-    def get_job(job_id: str) -> Optional[Dict]:
+    def get_job(job_id: str) -> Optional[JobState]:
         """Retrieve job by id"""
         return JobManager._jobs.get(job_id)
 
@@ -63,18 +91,18 @@ class JobManager:
         if not job:
             return False
 
-        job["status"] = status
-        job["processed_rows"] = processed_rows
-        job["current_row"] = current_row
+        job.status = status
+        job.processed_rows = processed_rows
+        job.current_row = current_row
 
-        if job["total_rows"] > 0:
-            job["progress_percent"] = (processed_rows / job["total_rows"]) * 100
+        if job.total_rows > 0:
+            job.progress_percent = (processed_rows / job.total_rows) * 100
 
-        if status == ExtractionStatus.PROCESSING and not job["started_at"]:
-            job["started_at"] = datetime.utcnow()
+        if status == ExtractionStatus.PROCESSING and not job.started_at:
+            job.started_at = datetime.utcnow()
 
         if status == ExtractionStatus.COMPLETED:
-            job["completed_at"] = datetime.utcnow()
+            job.completed_at = datetime.utcnow()
 
         return True
 
@@ -84,7 +112,7 @@ class JobManager:
         if not job:
             return False
 
-        job["results"].append(result)
+        job.results.append(result)
         return True
 
     @staticmethod
@@ -93,8 +121,8 @@ class JobManager:
         if not job:
             return False
         
-        job["status"] = status
-        job["completed_at"] = datetime.now(timezone.utc)
+        job.status = status
+        job.completed_at = datetime.now(timezone.utc)
         logger.info(f"Job {job_id} completed with status {status}")
         return True
 
@@ -105,11 +133,11 @@ class JobManager:
         if not job:
             return False
         
-        if job["status"] in [ExtractionStatus.COMPLETED, ExtractionStatus.FAILED]:
+        if job.status in [ExtractionStatus.COMPLETED, ExtractionStatus.FAILED]:
             return False
 
-        job["status"] = ExtractionStatus.CANCELLED
-        job["completed_at"] = datetime.now(timezone.utc)
+        job.status = ExtractionStatus.CANCELLED
+        job.completed_at = datetime.now(timezone.utc)
         logger.info(f"Job {job_id} cancelled")
         return True
 
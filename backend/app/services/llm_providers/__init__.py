@@ -1,11 +1,19 @@
 """LLM Providers Module - Factory pattern for provider selection"""
 
-from typing import Optional, Type, Dict
-from .base import BaseLLMProvider
+from collections import OrderedDict
+from typing import Optional, Type, Dict, Tuple
+import threading
+from .base import BaseLLMProvider, _hash_api_key
 
 # Lazy imports to avoid circular dependencies
 _PROVIDERS: Dict[str, Type[BaseLLMProvider]] = {}
 
+# Process-wide cache of initialized providers, so SDK clients, model handles
+# and HTTP sessions are built once per configuration rather than per job
+_INSTANCE_CACHE: "OrderedDict[Tuple, BaseLLMProvider]" = OrderedDict()
+_INSTANCE_CACHE_SIZE = 64
+_INSTANCE_CACHE_LOCK = threading.Lock()
+
 def _register_providers():
     """Register all available providers"""
     global _PROVIDERS
@@ -33,6 +41,9 @@ def get_provider(
 ) -> BaseLLMProvider:
     """
     Factory function to get provider instance
+
+    Instances are cached per (provider, model, api key, base URL, temperature)
+    and reused across calls.
     
     Args:
         provider_name: Name of provider ('openai', 'google', etc.)
@@ -57,13 +68,33 @@ def get_provider(
             f"Available providers: {available}"
         )
     
-    return provider_class(
+    cache_key = (
+        provider_class,
+        model_name,
+        _hash_api_key(api_key),
+        base_url,
+        temperature,
+    )
+    with _INSTANCE_CACHE_LOCK:
+        provider = _INSTANCE_CACHE.get(cache_key)
+        if provider is not None:
+            _INSTANCE_CACHE.move_to_end(cache_key)
+            return provider
+
+    provider = provider_class(
         model_name=model_name,
         api_key=api_key,
         base_url=base_url,
         temperature=temperature
     )
 
+    with _INSTANCE_CACHE_LOCK:
+        _INSTANCE_CACHE[cache_key] = provider
+        if len(_INSTANCE_CACHE) > _INSTANCE_CACHE_SIZE:
+            _INSTANCE_CACHE.popitem(last=False)
+
+    return provider
+
 def get_available_providers() -> Dict[str, dict]:
     """Get information about all available providers"""
     return {
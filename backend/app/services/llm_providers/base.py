@@ -1,16 +1,102 @@
 """Abstract base class for LLM providers"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Tuple, Type
+import hashlib
+import random
+import threading
 import time
 import json
 import logging
+import weakref
+
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# HTTP status codes worth retrying (rate limits and transient server errors)
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a provider's circuit breaker rejects a call"""
+
+
+class CircuitBreaker:
+    """
+    Minimal circuit breaker shared by the providers of one endpoint and API key.
+
+    After `fail_max` consecutive transient failures the circuit opens and
+    calls fail fast for `reset_timeout` seconds. After that it is half-open:
+    a single trial call is let through while other calls keep failing fast.
+    Success of the trial closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may proceed; in the half-open state only the first caller may"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_running or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+# Breakers per (provider class, base URL, API key hash), shared by the
+# provider instances of that configuration while any of them is alive
+_CIRCUIT_BREAKERS: "weakref.WeakValueDictionary[Tuple, CircuitBreaker]" = weakref.WeakValueDictionary()
+_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+
+def _hash_api_key(api_key: Optional[str]) -> Optional[str]:
+    """Hash API key for use in cache keys"""
+    if api_key is None:
+        return None
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _get_circuit_breaker(key: Tuple) -> CircuitBreaker:
+    """Get the circuit breaker for a provider configuration, creating it if needed"""
+    with _CIRCUIT_BREAKERS_LOCK:
+        breaker = _CIRCUIT_BREAKERS.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _CIRCUIT_BREAKERS[key] = breaker
+        return breaker
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM provider"""
 
+    # Retry policy for transient failures (jittered exponential backoff)
+    RETRY_BACKOFF_MULTIPLIER = 0.5
+    RETRY_MAX_WAIT = 8.0
+
+    # Exception types treated as transient; set by subclasses in _setup_client
+    _retryable_exceptions: Tuple[Type[BaseException], ...] = ()
+
     def __init__(
         self,
         model_name: str,
@@ -31,6 +117,11 @@ class BaseLLMProvider(ABC):
         self.api_key = api_key
         self.base_url = base_url
         self.temperature = temperature
+        # One breaker per endpoint and API key, so one user's rate limits or
+        # a custom endpoint's outage doesn't block calls for everyone else
+        self._circuit_breaker = _get_circuit_breaker((type(self), base_url, _hash_api_key(api_key)))
+        self._system_prompt = self._create_system_prompt()
+        self._system_message = {"role": "system", "content": self._system_prompt}
         self._setup_client()
 
 
@@ -56,6 +147,60 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    def _is_retryable(self, error: Exception) -> bool:
+        """Whether a failed call is transient and worth retrying"""
+        if isinstance(error, self._retryable_exceptions):
+            return True
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+        return status_code in RETRYABLE_STATUS_CODES
+
+    def _call_with_retry(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call the provider API, retrying transient failures
+
+        Retries up to settings.MAX_RETRIES attempts with jittered exponential
+        backoff. Calls fail fast with CircuitOpenError while the circuit
+        breaker for this endpoint and API key is open.
+
+        Args:
+            func: SDK/HTTP call to make
+            *args, **kwargs: Passed through to func
+
+        Returns:
+            Whatever func returns
+        """
+        breaker = self._circuit_breaker
+        if not breaker.allow():
+            raise CircuitOpenError(
+                f"{type(self).__name__} circuit is open after repeated failures; "
+                f"retry in {breaker.reset_timeout:.0f}s"
+            )
+
+        max_attempts = max(1, settings.MAX_RETRIES)
+        for attempt in range(1, max_attempts + 1):
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not self._is_retryable(e):
+                    # The endpoint answered, so it counts as reachable (and a
+                    # half-open trial ends) even though the request was rejected
+                    breaker.record_success()
+                    raise
+                if attempt == max_attempts:
+                    breaker.record_failure()
+                    raise
+                delay = random.uniform(
+                    0, min(self.RETRY_MAX_WAIT, self.RETRY_BACKOFF_MULTIPLIER * 2 ** attempt)
+                )
+                logger.warning(
+                    f"{type(self).__name__} transient error (attempt {attempt}/{max_attempts}), "
+                    f"retrying in {delay:.2f}s: {str(e)}"
+                )
+                time.sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+
     def _get_generation_params(self) -> Dict[str, Any]:
         """Get generation parameters, including temperature"""
         return {"temperature": self.temperature}
@@ -15,10 +15,17 @@ class GoogleProvider(BaseLLMProvider):
         """Setup Google AI client"""
         try:
             import google.generativeai as genai
+            from google.api_core import exceptions as google_exceptions
             
             if not self.api_key:
                 raise ValueError("Google API key is required")
             
+            self._retryable_exceptions = (
+                google_exceptions.ResourceExhausted,
+                google_exceptions.ServiceUnavailable,
+                google_exceptions.InternalServerError,
+                google_exceptions.DeadlineExceeded,
+            )
             genai.configure(api_key=self.api_key)
             self.model = genai.GenerativeModel(self.model_name)
             
@@ -33,7 +40,8 @@ class GoogleProvider(BaseLLMProvider):
         start_time = time.time()
         
         try:
-            response = self.model.generate_content(
+            response = self._call_with_retry(
+                self.model.generate_content,
                 content=prompt,
                 generation_config={
                     "temperature": self.temperature
@@ -14,15 +14,25 @@ class GrokProvider(BaseLLMProvider):
     def _setup_client(self):
         """Setup Grok client"""
         try:
-            from openai import OpenAI
+            from openai import OpenAI, APIConnectionError
             
             if not self.api_key:
                 raise ValueError("Grok API key is required")
             
+            # Rate limits and 5xx are retried via their HTTP status code
+            self._retryable_exceptions = (APIConnectionError,)
             self.client = OpenAI(
                 api_key=self.api_key,
+                max_retries=0,  # retries are handled by _call_with_retry
                 base_url="https://api.x.ai/v1"
             )
+
+            # Grok-3 reasoning models take an extra argument; decide once per instance
+            self._extra_kwargs = (
+                {"reasoning_effort": "high"}
+                if "grok-3" in self.model_name.lower()
+                else {}
+            )
             
         except ImportError:
             raise ImportError(
@@ -35,26 +45,16 @@ class GrokProvider(BaseLLMProvider):
         start_time = time.time()
         
         try:
-            # Special handling for Grok reasoning models
-            kwargs = {
-                "model": self.model_name,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": self._create_system_prompt()
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
+            response = self._call_with_retry(
+                self.client.chat.completions.create,
+                model=self.model_name,
+                messages=[
+                    self._system_message,
+                    {"role": "user", "content": prompt}
                 ],
-                "temperature": self.temperature
-            }
-            
-            if "grok-3" in self.model_name.lower():
-                kwargs["reasoning_effort"] = "high"
-            
-            response = self.client.chat.completions.create(**kwargs)
+                temperature=self.temperature,
+                **self._extra_kwargs
+            )
             
             time_taken = time.time() - start_time
             
@@ -17,6 +17,10 @@ class OllamaProvider(BaseLLMProvider):
             import requests
             self.base_url = self.base_url or "http://localhost:11434"
             self.session = requests.Session()
+            # Only connection failures (including connect timeouts) are retried.
+            # A read timeout already waited the full 5 minutes for a local model
+            # that will likely time out again
+            self._retryable_exceptions = (requests.ConnectionError,)
         except ImportError:
             raise ImportError(
                 "Requests library not installed. "
@@ -28,19 +32,22 @@ class OllamaProvider(BaseLLMProvider):
         start_time = time.time()
         
         try:
-            import requests
+            def _post():
+                # Pooled keep-alive connection from the provider's session
+                response = self.session.post(
+                    f"{self.base_url}/api/generate",
+                    json={
+                        "model": self.model_name,
+                        "prompt": prompt,
+                        "stream": False,
+                        "temperature": self.temperature
+                    },
+                    timeout=300  # 5 minute timeout for local LLMs
+                )
+                response.raise_for_status()
+                return response
             
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model_name,
-                    "prompt": prompt,
-                    "stream": False,
-                    "temperature": self.temperature
-                },
-                timeout=300  # 5 minute timeout for local LLMs
-            )
-            response.raise_for_status()
+            response = self._call_with_retry(_post)
             
             time_taken = time.time() - start_time
             response_data = response.json()
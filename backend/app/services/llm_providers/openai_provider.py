@@ -14,13 +14,16 @@ class OpenAIProvider(BaseLLMProvider):
     def _setup_client(self):
         """Setup OpenAI client"""
         try:
-            from openai import OpenAI
+            from openai import OpenAI, APIConnectionError
             
             if not self.api_key:
                 raise ValueError("OpenAI API key is required")
             
+            # Rate limits and 5xx are retried via their HTTP status code
+            self._retryable_exceptions = (APIConnectionError,)
             self.client = OpenAI(
                 api_key=self.api_key,
+                max_retries=0,  # retries are handled by _call_with_retry
                 base_url=self.base_url
             )
         except ImportError:
@@ -34,17 +37,12 @@ class OpenAIProvider(BaseLLMProvider):
         start_time = time.time()
         
         try:
-            response = self.client.chat.completions.create(
+            response = self._call_with_retry(
+                self.client.chat.completions.create,
                 model=self.model_name,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": self._create_system_prompt()
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
+                    self._system_message,
+                    {"role": "user", "content": prompt}
                 ],
                 temperature=self.temperature,
                 response_format={"type": "json_object"}  # Ensure JSON response
@@ -7,9 +7,108 @@ import io
 
 logger = logging.getLogger(__name__)
 
+# Reference/bibliography section headings
+_REFERENCE_MARKERS = (
+    re.compile(r'\n\s*(references|bibliography|works cited|citations)\s*\n', re.IGNORECASE),
+    re.compile(r'\n\s*\[?references?\]?\s*\n', re.IGNORECASE),
+)
+
+# Abstract headings: "Abstract"/"Summary" on its own line, or "Abstract" at the start
+_ABSTRACT_MARKERS = (
+    re.compile(r'\n\s*abstract\s*\n', re.IGNORECASE),
+    re.compile(r'\n\s*summary\s*\n', re.IGNORECASE),
+)
+_LEADING_ABSTRACT_MARKER = re.compile(r'\s*abstract\s*\n', re.IGNORECASE)
+
+# Where the abstract ends: "1.", "Introduction" or "Background" on its own line
+_INTRODUCTION_MARKER = re.compile(r'\n\s*(?:1\.|introduction|background)\s*\n', re.IGNORECASE)
+_NUMBERED_SECTION = re.compile(r'\n\s*\d+\.')
+
+# In-text citations, removed in this order (removing one kind can expose another):
+# - (Author, Year) or (Author et al., Year)
+# - [1], [2-5], [1,2,3] (numeric)
+# - [Author et al. Year] (bracketed author-year)
+_CITATION_PATTERNS = (
+    re.compile(r'\([A-Z][a-zA-Z\s]+(?:et\s+al\.)?,?\s*\d{4}[a-z]?\)'),
+    re.compile(r'\[\d+(?:[-\s,]\d+)*\]'),
+    re.compile(r'\[[A-Z][a-zA-Z\s]+(?:et\s+al\.)?\s+\d{4}\]'),
+)
+
+_WHITESPACE_RUN = re.compile(r'\s+')
+
 class PDFService:
     """Service for processing PDF files"""
 
+    @staticmethod
+    def _find_references_start(text: str) -> Optional[int]:
+        """Offset where the references section starts, if any"""
+        for marker in _REFERENCE_MARKERS:
+            match = marker.search(text)
+            if match:
+                return match.start()
+        return None
+
+    @staticmethod
+    def _strip_bounds(text: str, start: int, end: int) -> Tuple[int, int]:
+        """Narrow text[start:end] to exclude leading/trailing whitespace"""
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    @staticmethod
+    def _find_title_end(text: str, start: int, end: int, max_title_lines: int) -> Optional[int]:
+        """
+        Offset just past the title lines of text[start:end].
+
+        Returns None when the text has too few lines to contain a separate title.
+        """
+        if text.count('\n', start, end) < max_title_lines:
+            return None
+
+        pos = start
+        for _ in range(max_title_lines):
+            newline = text.find('\n', pos, end)
+            line = text[pos:newline].strip()
+            if len(line) < 100 and line:
+                pos = newline + 1
+            else:
+                break
+        return pos
+
+    @staticmethod
+    def _find_abstract(text: str, start: int, end: int) -> Optional[Tuple[int, int]]:
+        """
+        Locate the abstract within text[start:end].
+
+        Returns:
+            (abstract_start, resume_at) span to drop, or None if no abstract
+        """
+        for marker in _ABSTRACT_MARKERS:
+            match = marker.search(text, start, end)
+            if match:
+                break
+        else:
+            match = _LEADING_ABSTRACT_MARKER.match(text, start, end)
+            if not match:
+                return None
+
+        abstract_start = match.end()  # Where abstract content begins
+
+        # Abstract ends where the introduction starts...
+        section = (
+            _INTRODUCTION_MARKER.search(text, abstract_start, end)
+            # ...or failing that, at the first numbered section
+            or _NUMBERED_SECTION.search(text, abstract_start, end)
+        )
+        if section:
+            return match.start(), section.start()
+
+        # If nothing found, just drop the abstract marker line
+        resume_at, _ = PDFService._strip_bounds(text, abstract_start, end)
+        return match.start(), resume_at
+
     @staticmethod
     def remove_references(text: str) -> str:
         """
@@ -21,17 +120,10 @@ class PDFService:
         Returns:
             Text with references section removed
         """
-        reference_markers = [
-            r'(?i)\n\s*(references|bibliography|works cited|citations)\s*\n',
-            r'(?i)\n\s*\[?references?\]?\s*\n',
-        ]
-
-        for marker in reference_markers:
-            match = re.search(marker, text)
-            if match:
-                text = text[:match.start()]
-                logger.info("Removed references section from PDF")
-                break
+        references_start = PDFService._find_references_start(text)
+        if references_start is not None:
+            text = text[:references_start]
+            logger.info("Removed references section from PDF")
 
         return text.strip()
 
@@ -52,20 +144,11 @@ class PDFService:
         Returns:
             Text with title removed
         """
-        lines = text.split('\n')
-
-        if len(lines) <= max_title_lines:
+        title_end = PDFService._find_title_end(text, 0, len(text), max_title_lines)
+        if title_end is None:
             return text
-        
-        title_end = 0
-        for i in range(min(max_title_lines, len(lines))):
-            line = lines[i].strip()
-            if len(line) < 100 and line:
-                title_end = i+1
-            else:
-                break
 
-        return '\n'.join(lines[title_end:]).strip()
+        return text[title_end:].strip()
         
     @staticmethod
     def remove_abstract(text: str) -> str:
@@ -82,41 +165,13 @@ class PDFService:
         Returns:
             Text with abstract removed
         """
-        # Common abstract markers (case-insensitive)
-        abstract_patterns = [
-            r'(?i)\n\s*abstract\s*\n',           # "Abstract" on its own line
-            r'(?i)\n\s*summary\s*\n',            # "Summary" on its own line
-            r'(?i)^\s*abstract\s*\n',            # "Abstract" at start
-        ]
-        
-        # Introduction markers (where abstract ends)
-        introduction_patterns = [
-            r'(?i)\n\s*(?:1\.|introduction|background)\s*\n',  # "1. Introduction" or "Introduction"
-            r'(?i)\n\s*(?:1\s+introduction)\s*\n',            # "1 Introduction"
-        ]
-        
-        # Search for abstract marker
-        for pattern in abstract_patterns:
-            match = re.search(pattern, text)
-            if match:
-                abstract_start = match.end()  # Where abstract content begins
-                
-                # Find where introduction starts (end of abstract)
-                intro_match = re.search(introduction_patterns[0], text[abstract_start:])
-                if intro_match:
-                    # Found introduction - remove everything from abstract start to intro start
-                    return text[:match.start()] + text[abstract_start + intro_match.start():]
-                
-                # If no introduction found, look for first numbered section
-                section_match = re.search(r'\n\s*\d+\.', text[abstract_start:])
-                if section_match:
-                    return text[:match.start()] + text[abstract_start + section_match.start():]
-                
-                # If nothing found, just remove the abstract marker line
-                return text[:match.start()] + text[abstract_start:].lstrip()
-        
-        # No abstract found, return original text
-        return text
+        abstract = PDFService._find_abstract(text, 0, len(text))
+        if abstract is None:
+            # No abstract found, return original text
+            return text
+
+        abstract_start, resume_at = abstract
+        return text[:abstract_start] + text[resume_at:]
 
     @staticmethod
     def remove_in_text_citations(text: str) -> str:
@@ -127,6 +182,8 @@ class PDFService:
         - (Author, Year) or (Author et al., Year)
         - [1], [2-5], [1,2,3] (numeric)
         - [Author et al. Year] (bracketed author-year)
+
+        Also collapses whitespace and removes spaces left before punctuation.
         
         Args:
             text: PDF text
@@ -134,28 +191,14 @@ class PDFService:
         Returns:
             Text with citations removed
         """
-        # Pattern 1: (Author, Year) or (Author et al., Year)
-        # Matches: (Smith, 2023), (Smith et al., 2023), (Smith et al. 2023)
-        pattern1 = r'\([A-Z][a-zA-Z\s]+(?:et\s+al\.)?,?\s*\d{4}[a-z]?\)'
-        
-        # Pattern 2: [1], [2-5], [1,2,3] (numeric citations)
-        pattern2 = r'\[\d+(?:[-\s,]\d+)*\]'
-        
-        # Pattern 3: [Author et al. Year] (bracketed author-year)
-        pattern3 = r'\[[A-Z][a-zA-Z\s]+(?:et\s+al\.)?\s+\d{4}\]'
-        
-        # Remove all patterns
-        text = re.sub(pattern1, '', text)
-        text = re.sub(pattern2, '', text)
-        text = re.sub(pattern3, '', text)
-        
-        # Clean up extra spaces left behind
-        # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text)
-        # Fix spaces before punctuation
-        text = re.sub(r'\s+\.', '.', text)
-        text = re.sub(r'\s+,', ',', text)
-        
+        for pattern in _CITATION_PATTERNS:
+            text = pattern.sub('', text)
+
+        # Clean up extra spaces left behind: collapse whitespace runs,
+        # then drop the single space left before punctuation
+        text = _WHITESPACE_RUN.sub(' ', text)
+        text = text.replace(' .', '.').replace(' ,', ',')
+
         return text.strip()
 
     @staticmethod
@@ -169,10 +212,14 @@ class PDFService:
         Comprehensive PDF text cleaning.
         
         Removes in order:
-        1. References/Bibliography (already exists)
+        1. References/Bibliography
         2. Title
         3. Abstract
         4. In-text citations
+
+        Section boundaries are located as offsets on the original text and
+        the kept spans are joined once, so only the citation cleanup walks
+        the full text.
         
         Args:
             text: Raw PDF text
@@ -180,21 +227,32 @@ class PDFService:
         Returns:
             Cleaned text ready for extraction
         """
-        cleaned = text
-        
-        # Step 1: Remove references (already exists)
-        cleaned = PDFService.remove_references(cleaned)
-        
-        # Step 2: Remove title
-        cleaned = PDFService.remove_title(cleaned)
-        
-        # Step 3: Remove abstract
-        cleaned = PDFService.remove_abstract(cleaned)
-        
-        # Step 4: Remove in-text citations
-        cleaned = PDFService.remove_in_text_citations(cleaned)
-        
-        return cleaned.strip()
+        end = PDFService._find_references_start(text)
+        if end is not None:
+            logger.info("Removed references section from PDF")
+        else:
+            end = len(text)
+        start, end = PDFService._strip_bounds(text, 0, end)
+
+        title_end = PDFService._find_title_end(text, start, end, max_title_lines=3)
+        if title_end is not None:
+            start, end = PDFService._strip_bounds(text, title_end, end)
+
+        abstract = PDFService._find_abstract(text, start, end)
+        if abstract is None:
+            kept = text[start:end]
+        else:
+            abstract_start, resume_at = abstract
+            kept = "".join((text[start:abstract_start], text[resume_at:end]))
+
+        return PDFService.remove_in_text_citations(kept)
+
+    @staticmethod
+    def _open_reader(pdf_content: bytes):
+        """Create a PyPDF2 reader over in-memory PDF bytes"""
+        import PyPDF2
+
+        return PyPDF2.PdfReader(io.BytesIO(pdf_content))
 
     @staticmethod
     def extract_text(pdf_content: bytes) -> str:
@@ -211,20 +269,17 @@ class PDFService:
             ValueError: If PDF cannot be read
         """
         try:
-            import PyPDF2
+            pdf_reader = PDFService._open_reader(pdf_content)
             
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
+            parts = []
             for page_num, page in enumerate(pdf_reader.pages):
                 try:
-                    text += page.extract_text()
+                    parts.append(page.extract_text())
                 except Exception as e:
                     logger.warning(f"Error extracting text from page {page_num + 1}: {str(e)}")
                     continue
             
-            text = PDFService.remove_references(text)
+            text = PDFService.remove_references("".join(parts))
             
             return text
             
@@ -251,16 +306,13 @@ class PDFService:
             ValueError: If PDF cannot be read
         """
         try:
-            import PyPDF2
-            
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            pdf_reader = PDFService._open_reader(pdf_content)
             
             pages = []
             for page_num, page in enumerate(pdf_reader.pages):
                 try:
                     text = page.extract_text()
-                    if text.strip():  # Only add non-empty pages
+                    if text and not text.isspace():  # Only add non-empty pages
                         pages.append({
                             "page": page_num + 1,
                             "text": text
@@ -291,10 +343,7 @@ class PDFService:
             Tuple of (is_valid, error_message)
         """
         try:
-            import PyPDF2
-            
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            pdf_reader = PDFService._open_reader(pdf_content)
             
             if len(pdf_reader.pages) == 0:
                 return False, "PDF file has no pages"
@@ -316,10 +365,7 @@ class PDFService:
             Dictionary with page count and metadata
         """
         try:
-            import PyPDF2
-            
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            pdf_reader = PDFService._open_reader(pdf_content)
             
             return {
                 "page_count": len(pdf_reader.pages),
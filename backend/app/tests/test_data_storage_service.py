@@ -0,0 +1,36 @@
+import pytest
+from pydantic import BaseModel
+from app.services.data_storage_service import DataStorageService
+
+
+class _Extraction(BaseModel):
+    value: str
+    confidence: float
+
+
+@pytest.fixture
+def storage_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataStorageService, "STORAGE_DIR", tmp_path)
+    return tmp_path
+
+
+class TestJobStorage:
+    def test_rows_round_trip(self, storage_dir):
+        """Rows are written and read back unchanged"""
+        rows = [{"row_id": "1", "text": "Zażółć gęślą jaźń"}]
+        DataStorageService.store_job_rows("job", rows)
+        assert DataStorageService.get_job_rows("job") == rows
+
+    def test_results_serialize_pydantic_models(self, storage_dir):
+        """Pydantic models in results are stored as plain dicts"""
+        DataStorageService.store_job_rows("job", [])
+        results = [{"row_id": "1", "extractions": {"topic": _Extraction(value="bees", confidence=0.9)}}]
+        DataStorageService.store_job_results("job", results)
+        
+        assert DataStorageService.get_job_results("job") == [
+            {"row_id": "1", "extractions": {"topic": {"value": "bees", "confidence": 0.9}}}
+        ]
+
+    def test_missing_job_returns_empty(self, storage_dir):
+        assert DataStorageService.get_job_rows("missing") == []
+        assert DataStorageService.get_job_results("missing") == []
@@ -0,0 +1,181 @@
+import threading
+
+import pytest
+from app.services.llm_providers import base
+from app.services.llm_providers.base import BaseLLMProvider, CircuitBreaker, CircuitOpenError
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = type("Response", (), {"status_code": status_code})()
+
+
+class _FakeProvider(BaseLLMProvider):
+    def _setup_client(self):
+        self._retryable_exceptions = (ConnectionError,)
+
+    def generate_response(self, prompt):
+        raise NotImplementedError
+
+
+class _FlakyCall:
+    """Callable that raises the given errors in turn, then succeeds"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    monkeypatch.setattr(base.settings, "MAX_RETRIES", 3)
+    provider = _FakeProvider("fake-model")
+    provider._circuit_breaker = CircuitBreaker(fail_max=2, reset_timeout=30.0)
+    return provider
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping; jitter always picks the upper bound"""
+    delays = []
+    monkeypatch.setattr(base.time, "sleep", delays.append)
+    monkeypatch.setattr(base.random, "uniform", lambda low, high: high)
+    return delays
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the circuit breaker"""
+    now = [1000.0]
+    monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestCallWithRetry:
+    def test_retries_transient_errors_until_success(self, provider, sleeps):
+        """Transient failures are retried and the eventual result returned"""
+        call = _FlakyCall(ConnectionError(), _HTTPError(503))
+        assert provider._call_with_retry(call) == "ok"
+        assert call.calls == 3
+
+    def test_gives_up_after_max_attempts(self, provider, sleeps):
+        """The last transient error is raised once MAX_RETRIES attempts are used"""
+        call = _FlakyCall(*[ConnectionError()] * 5)
+        with pytest.raises(ConnectionError):
+            provider._call_with_retry(call)
+        assert call.calls == 3
+
+    def test_does_not_retry_permanent_errors(self, provider, sleeps):
+        """Non-transient errors (e.g. HTTP 400) are raised immediately"""
+        call = _FlakyCall(_HTTPError(400))
+        with pytest.raises(_HTTPError):
+            provider._call_with_retry(call)
+        assert call.calls == 1
+        assert sleeps == []
+
+    def test_backoff_grows_exponentially_up_to_the_cap(self, provider, sleeps, monkeypatch):
+        """Waits double per attempt and never exceed RETRY_MAX_WAIT"""
+        monkeypatch.setattr(base.settings, "MAX_RETRIES", 6)
+        call = _FlakyCall(*[ConnectionError()] * 5)
+        assert provider._call_with_retry(call) == "ok"
+        assert sleeps == [1.0, 2.0, 4.0, 8.0, 8.0]
+
+
+class TestCircuitBreaker:
+    def test_opens_after_repeated_failures(self, provider, sleeps):
+        """Calls fail fast once fail_max calls have exhausted their retries"""
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                provider._call_with_retry(_FlakyCall(*[ConnectionError()] * 3))
+
+        call = _FlakyCall()
+        with pytest.raises(CircuitOpenError):
+            provider._call_with_retry(call)
+        assert call.calls == 0
+
+    def test_half_open_trial_success_closes(self, provider, sleeps, clock):
+        """After reset_timeout one trial call is let through; success closes the circuit"""
+        breaker = provider._circuit_breaker
+        breaker.record_failure()
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        clock[0] += 30.0
+        assert provider._call_with_retry(_FlakyCall()) == "ok"
+
+        # Closed again: a single new failure doesn't reopen it
+        breaker.record_failure()
+        assert breaker.allow()
+
+    def test_half_open_trial_failure_reopens(self, provider, sleeps, clock):
+        """A failed trial call reopens the circuit for another reset_timeout"""
+        breaker = provider._circuit_breaker
+        breaker.record_failure()
+        breaker.record_failure()
+
+        clock[0] += 30.0
+        with pytest.raises(ConnectionError):
+            provider._call_with_retry(_FlakyCall(*[ConnectionError()] * 3))
+
+        assert not breaker.allow()
+        clock[0] += 30.0
+        assert breaker.allow()
+
+    def test_half_open_admits_a_single_trial(self, provider, sleeps, clock):
+        """Of two callers arriving after reset_timeout, only one gets through"""
+        breaker = provider._circuit_breaker
+        breaker.record_failure()
+        breaker.record_failure()
+        clock[0] += 30.0
+
+        trial_started = threading.Event()
+        finish_trial = threading.Event()
+
+        def trial():
+            trial_started.set()
+            finish_trial.wait(5)
+            return "ok"
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(provider._call_with_retry(trial)))
+        first.start()
+        assert trial_started.wait(5)
+
+        second_call = _FlakyCall()
+        with pytest.raises(CircuitOpenError):
+            provider._call_with_retry(second_call)
+        assert second_call.calls == 0
+
+        finish_trial.set()
+        first.join(5)
+        assert results == ["ok"]
+        assert provider._call_with_retry(_FlakyCall()) == "ok"
+
+    def test_breaker_is_per_endpoint_and_api_key(self):
+        """Providers share a breaker only for the same class, base URL and API key"""
+        class _OtherProvider(_FakeProvider):
+            pass
+
+        provider = _FakeProvider("fake-model", api_key="key-a")
+        assert _FakeProvider("other-model", api_key="key-a")._circuit_breaker is provider._circuit_breaker
+        assert _FakeProvider("fake-model", api_key="key-b")._circuit_breaker is not provider._circuit_breaker
+        assert _FakeProvider("fake-model", api_key="key-a", base_url="http://localhost:8080")._circuit_breaker \
+            is not provider._circuit_breaker
+        assert _OtherProvider("fake-model", api_key="key-a")._circuit_breaker is not provider._circuit_breaker
+
+    def test_failures_for_one_api_key_dont_block_another(self, sleeps):
+        """An open circuit for one key leaves other keys' calls alone"""
+        blocked = _FakeProvider("fake-model", api_key="over-quota")
+        for _ in range(blocked._circuit_breaker.fail_max):
+            blocked._circuit_breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            blocked._call_with_retry(_FlakyCall())
+        assert _FakeProvider("fake-model", api_key="other-user")._call_with_retry(_FlakyCall()) == "ok"
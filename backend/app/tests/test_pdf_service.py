@@ -0,0 +1,85 @@
+import pytest
+from app.services.pdf_service import PDFService
+
+
+# Expected outputs were produced by the original step-by-step implementation
+# (remove_references -> remove_title -> remove_abstract -> remove_in_text_citations)
+CLEAN_CASES = {
+    "references_title_abstract_citations": (
+        "Nest Predation in Forest Birds\nJ. Smith and A. Doe\nUniversity of Somewhere\n"
+        "Abstract\nWe studied nests (Smith et al., 2020) in forests [1].\nResults were clear [2-5] .\n"
+        "1. Introduction\nBirds nest in trees (Doe, 2019) , as shown [Brown et al. 2018].\n"
+        "References\nSmith J. 2020. Nests. Journal.\n",
+        "1. Introduction Birds nest in trees, as shown.",
+    ),
+    "summary_ending_at_numbered_section": (
+        "Short title\n\nThis first paragraph is long enough to stop the title scan because it goes "
+        "well beyond one hundred characters in length overall.\nSummary\nA summary paragraph here.\n"
+        "2. Methods\nWe counted eggs [3,4].\nBibliography\nA. B. 2001.",
+        "This first paragraph is long enough to stop the title scan because it goes well beyond "
+        "one hundred characters in length overall. 2. Methods We counted eggs.",
+    ),
+    "leading_abstract_without_introduction": (
+        "Abstract\n   Body text without any sections at all (Lee, 2001a).",
+        "Body text without any sections at all.",
+    ),
+    "no_sections": (
+        "Just one line of body text [12].",
+        "Just one line of body text.",
+    ),
+    "too_few_lines_for_a_title": (
+        "Title\nBody",
+        "Title Body",
+    ),
+    "bracketed_references_heading": (
+        "T1\nT2\nT3\nBody text continues here.\n[References]\nX",
+        "Body text continues here.",
+    ),
+    "citation_exposed_by_earlier_removal": (
+        "A\nB\nC\nSee [Smith [1] 2020] and (Jones 1999).\n",
+        "See and.",
+    ),
+    "whitespace_and_punctuation_cleanup": (
+        "A\nB\nC\nWords   spread\n\nacross  lines .  End ,done.",
+        "Words spread across lines. End,done.",
+    ),
+}
+
+
+class _FakePage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        return self.text
+
+
+class _FakeReader:
+    def __init__(self, *page_texts):
+        self.pages = [_FakePage(text) for text in page_texts]
+
+
+class TestCleanPdfText:
+    @pytest.mark.parametrize("text,expected", CLEAN_CASES.values(), ids=CLEAN_CASES.keys())
+    def test_matches_original_output(self, text, expected):
+        """The offset-based cleaner reproduces the original implementation's output"""
+        assert PDFService.clean_pdf_text(text) == expected
+
+    @pytest.mark.parametrize("text", [text for text, _ in CLEAN_CASES.values()], ids=CLEAN_CASES.keys())
+    def test_matches_public_helpers_chained(self, text):
+        """clean_pdf_text equals running the public remove_* helpers in order"""
+        chained = PDFService.remove_in_text_citations(
+            PDFService.remove_abstract(
+                PDFService.remove_title(
+                    PDFService.remove_references(text)
+                )
+            )
+        ).strip()
+        assert PDFService.clean_pdf_text(text) == chained
+
+
+class TestExtractText:
+    def test_pages_joined_and_references_removed(self, monkeypatch):
+        """Pages are joined as-is and the references section dropped"""
+        monkeypatch.setattr(PDFService, "_open_reader", lambda content: _FakeReader("Body text\n", "More\nReferences\nA. 2001"))
+        assert PDFService.extract_text(b"") == "Body text\nMore"
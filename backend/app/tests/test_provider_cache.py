@@ -0,0 +1,76 @@
+from collections import OrderedDict
+
+import pytest
+from app.services import llm_providers
+from app.services.llm_providers import BaseLLMProvider, get_provider
+
+
+class _FakeProvider(BaseLLMProvider):
+    def _setup_client(self):
+        if not self.api_key:
+            raise ValueError("Fake API key is required")
+
+    def generate_response(self, prompt):
+        raise NotImplementedError
+
+
+@pytest.fixture(autouse=True)
+def fake_registry(monkeypatch):
+    """Register only the fake provider and start each test with an empty instance cache"""
+    monkeypatch.setattr(llm_providers, "_PROVIDERS", {"fake": _FakeProvider})
+    monkeypatch.setattr(llm_providers, "_INSTANCE_CACHE", OrderedDict())
+
+
+class TestProviderInstanceCache:
+    def test_same_configuration_reuses_instance(self):
+        """Same provider, model, key, base URL and temperature return the cached instance"""
+        first = get_provider("fake", "model", api_key="key", base_url="http://host", temperature=0.2)
+        second = get_provider("FAKE", "model", api_key="key", base_url="http://host", temperature=0.2)
+        assert second is first
+
+    @pytest.mark.parametrize("changes", [
+        {"api_key": "other-key"},
+        {"temperature": 0.9},
+        {"model_name": "other-model"},
+        {"base_url": "http://other-host"},
+    ])
+    def test_different_configuration_gets_new_instance(self, changes):
+        """Changing any part of the configuration builds a new provider"""
+        config = {"model_name": "model", "api_key": "key", "base_url": None, "temperature": 0.2}
+        first = get_provider("fake", **config)
+        other = get_provider("fake", **{**config, **changes})
+        assert other is not first
+        assert get_provider("fake", **config) is first
+
+    def test_evicts_least_recently_used_beyond_limit(self):
+        """At most _INSTANCE_CACHE_SIZE instances are kept; the oldest goes first"""
+        size = llm_providers._INSTANCE_CACHE_SIZE
+        assert size == 64
+        first = get_provider("fake", "model", api_key="key-0")
+        second = get_provider("fake", "model", api_key="key-1")
+        for i in range(2, size):
+            get_provider("fake", "model", api_key=f"key-{i}")
+        assert len(llm_providers._INSTANCE_CACHE) == size
+
+        # Using the first entry makes the second the least recently used
+        assert get_provider("fake", "model", api_key="key-0") is first
+        get_provider("fake", "model", api_key=f"key-{size}")
+
+        assert len(llm_providers._INSTANCE_CACHE) == size
+        assert get_provider("fake", "model", api_key="key-0") is first
+        assert get_provider("fake", "model", api_key="key-1") is not second
+
+    def test_failed_construction_is_not_cached(self):
+        """A provider that fails to initialize (e.g. missing key) leaves no cache entry"""
+        with pytest.raises(ValueError):
+            get_provider("fake", "model", api_key=None)
+        assert len(llm_providers._INSTANCE_CACHE) == 0
+
+        with pytest.raises(ValueError):
+            get_provider("fake", "model", api_key=None)
+
+    def test_api_key_is_not_stored_in_cache_key(self):
+        """Cache keys hold a hash of the API key, not the key itself"""
+        get_provider("fake", "model", api_key="secret-key")
+        (cache_key,) = llm_providers._INSTANCE_CACHE
+        assert "secret-key" not in cache_key
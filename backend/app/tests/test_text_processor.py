@@ -28,6 +28,29 @@ class TestTextProcessor:
         for (start, end), sentence in zip(offsets, sentences):
             assert text[start:end] == sentence
 
+    def test_fallback_skips_abbreviations(self):
+        """Regex fallback doesn't split after abbreviations or initials"""
+        text = "Dr. Smith et al. studied P. major nests, e.g. Great Tits. Results were clear."
+        sentences = TextProcessor._fallback_split(text)
+        assert sentences == [
+            "Dr. Smith et al. studied P. major nests, e.g. Great Tits.",
+            "Results were clear."
+        ]
+        
+        text = "Birds were counted in 2020. Nests were rare! Why? Unknown."
+        sentences = TextProcessor._fallback_split(text)
+        assert sentences == [
+            "Birds were counted in 2020.", "Nests were rare!", "Why?", "Unknown."
+        ]
+
+    def test_fallback_splits_after_single_digit(self):
+        """A sentence ending in a single digit is still split, unlike an initial"""
+        text = "The count was 5. Next one starts. Sample size was n = 5. Plots were small."
+        sentences = TextProcessor._fallback_split(text)
+        assert sentences == [
+            "The count was 5.", "Next one starts.", "Sample size was n = 5.", "Plots were small."
+        ]
+
     def test_sentence_offsets(self):
         text = "The fox is swift. It lives in forests."
         sentences = TextProcessor.split_sentences(text)
@@ -39,6 +62,23 @@ class TestTextProcessor:
         for (start, end), sentence in zip(offsets, sentences):
             assert text[start:end] == sentence
     
+    def test_sentence_offsets_skip_whitespace(self):
+        text = "  First one.\n\n Second one.\tThird one.  "
+        sentences = ["First one.", "Second one.", "Third one."]
+        offsets = TextProcessor.get_sentence_offsets(text, sentences)
+        
+        assert offsets == [(2, 12), (15, 26), (27, 37)]
+        for (start, end), sentence in zip(offsets, sentences):
+            assert text[start:end] == sentence
+    
+    def test_sentence_offsets_search_fallback(self):
+        """Sentences not at the cursor are located by searching ahead"""
+        text = "Intro text. [1] Cited sentence."
+        sentences = ["Intro text.", "Cited sentence."]
+        offsets = TextProcessor.get_sentence_offsets(text, sentences)
+        
+        assert offsets == [(0, 11), (16, 31)]
+    
     def test_numbers_and_decimals(self):
         """Test decimal numbers aren't treated as sentence ends"""
         text = "The value was 3.14159. Results were positive."
@@ -54,4 +94,30 @@ class TestTextProcessor:
         text = "This is one sentence"
         sentences = TextProcessor.split_sentences(text)
         assert len(sentences) == 1
-        assert sentences[0] == "This is one sentence"
\ No newline at end of file
+        assert sentences[0] == "This is one sentence"
+    
+    def test_split_with_offsets_punkt_spans(self, monkeypatch):
+        """Offsets come straight from Punkt spans and slice back to each sentence"""
+        from nltk.tokenize.punkt import PunktSentenceTokenizer
+        monkeypatch.setattr("app.utils.text._PUNKT", PunktSentenceTokenizer())
+        
+        text = "  First sentence here.   Second one follows!\nThird line ends. "
+        spans = TextProcessor.split_with_offsets(text)
+        
+        assert [sentence for sentence, _, _ in spans] == [
+            "First sentence here.", "Second one follows!", "Third line ends."
+        ]
+        for sentence, start, end in spans:
+            assert text[start:end] == sentence
+    
+    def test_split_with_offsets_matches_fallback(self, monkeypatch):
+        """Without Punkt, results match split_sentences + get_sentence_offsets"""
+        monkeypatch.setattr("app.utils.text._PUNKT", None)
+        
+        text = "Dr. Smith studied P. major nests. Results were clear."
+        sentences = TextProcessor.split_sentences(text)
+        offsets = TextProcessor.get_sentence_offsets(text, sentences)
+        
+        assert TextProcessor.split_with_offsets(text) == [
+            (sentence, start, end) for sentence, (start, end) in zip(sentences, offsets)
+        ]
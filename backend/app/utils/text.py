@@ -1,16 +1,93 @@
 import nltk
 import re
+from nltk.tokenize import punkt
 from typing import List, Tuple
 
-# Download punkt tokenizer on first import
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+# nltk >= 3.8.2 reads Punkt parameters from 'punkt_tab'; older releases load pickled 'punkt' models
+_PUNKT_RESOURCE = 'punkt_tab' if hasattr(punkt, 'PunktTokenizer') else 'punkt'
+
+def _load_punkt():
+    """Load the English Punkt tokenizer, or None if its data is unavailable"""
+    try:
+        if _PUNKT_RESOURCE == 'punkt_tab':
+            return punkt.PunktTokenizer('english')
+        return nltk.data.load('tokenizers/punkt/english.pickle')
+    except (LookupError, OSError):
+        return None
+
+# Loaded once so split_sentences skips sent_tokenize's per-call lookup and language dispatch.
+# Import never downloads; the app calls ensure_punkt() once at startup
+_PUNKT = _load_punkt()
+
+
+def ensure_punkt() -> bool:
+    """
+    Make the Punkt tokenizer available, downloading its data if missing.
+    
+    Returns:
+        True if Punkt is loaded, False if splitting will use the regex fallback
+    """
+    global _PUNKT
+    if _PUNKT is not None:
+        return True
+    
+    try:
+        nltk.data.find(f'tokenizers/{_PUNKT_RESOURCE}')
+    except LookupError:
+        nltk.download(_PUNKT_RESOURCE, quiet=True)
+    
+    _PUNKT = _load_punkt()
+    return _PUNKT is not None
+
+# Sentence-ending punctuation followed by whitespace and a capital letter
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+# Coarser fallbacks for PDF text without usable punctuation
+_PARAGRAPH_SPLIT = re.compile(r'\n\s*\n')
+_LINE_SPLIT = re.compile(r'\n(?=[A-Z])')
+
+# Abbreviations (lowercase, without the final ".") that don't end a sentence.
+# Single letters (initials, abbreviated genus names like "P. major") are also skipped
+_ABBREVIATIONS = frozenset({
+    "al", "approx", "ca", "cf", "dr", "e.g", "eq", "fig", "figs", "i.e",
+    "jr", "mr", "mrs", "ms", "mt", "prof", "sp", "spp", "ssp", "st",
+    "subsp", "var", "vs",
+})
 
 class TextProcessor:
     """Utilities for text processing and sentence splitting"""
     
+    @staticmethod
+    def _split_on_punctuation(text: str) -> List[str]:
+        """
+        Split after . ! ? followed by whitespace and a capital letter.
+
+        Boundaries after a known abbreviation are skipped with a set lookup
+        on the preceding word.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            List of (unstripped) sentences
+        """
+        sentences = []
+        start = 0
+        for boundary in _SENT_SPLIT.finditer(text):
+            end = boundary.start()
+            if text[end - 1] == '.':
+                word_start = end - 1
+                while word_start > start and not text[word_start - 1].isspace():
+                    word_start -= 1
+                word = text[word_start:end - 1].lstrip('([').lower()
+                # Single-letter initials (P. major), not single digits (n = 5.)
+                if (len(word) == 1 and word.isalpha()) or word in _ABBREVIATIONS:
+                    continue
+            sentences.append(text[start:end])
+            start = boundary.end()
+        sentences.append(text[start:])
+        return sentences
+    
     @staticmethod
     def _fallback_split(text: str) -> List[str]:
         """
@@ -26,18 +103,18 @@ class TextProcessor:
             List of sentences
         """
         # Split on sentence-ending punctuation followed by space and capital letter
-        sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', text)
-        result = [s.strip() for s in sentences if s.strip()]
+        sentences = TextProcessor._split_on_punctuation(text)
+        result = [s.strip() for s in sentences if s and not s.isspace()]
         
         # If still single long sentence, try splitting on double newlines
         if len(result) == 1 and len(result[0]) > 1500:
-            sentences = re.split(r'\n\s*\n', text)
-            result = [s.strip() for s in sentences if s.strip()]
+            sentences = _PARAGRAPH_SPLIT.split(text)
+            result = [s.strip() for s in sentences if s and not s.isspace()]
         
         # If still single long sentence, try splitting on single newlines followed by capital
         if len(result) == 1 and len(result[0]) > 1500:
-            sentences = re.split(r'\n(?=[A-Z])', text)
-            result = [s.strip() for s in sentences if s.strip()]
+            sentences = _LINE_SPLIT.split(text)
+            result = [s.strip() for s in sentences if s and not s.isspace()]
         
         return result if result else [text.strip()]
     
@@ -55,13 +132,16 @@ class TextProcessor:
         Returns:
             List of sentences (stripped)
         """
-        if not text or len(text.strip()) == 0:
+        if not text or text.isspace():
             return []
         
+        if _PUNKT is None:
+            return TextProcessor._fallback_split(text)
+
         try:
-            sentences = nltk.sent_tokenize(text)
+            sentences = _PUNKT.tokenize(text)
             # Strip whitespace
-            result = [sent.strip() for sent in sentences if sent.strip()]
+            result = [sent.strip() for sent in sentences if sent and not sent.isspace()]
             
             # If NLTK returns single sentence > 2000 chars, try regex fallback
             # This often happens with PDF text that lacks proper punctuation
@@ -73,6 +153,50 @@ class TextProcessor:
             # Fallback to regex-based split if NLTK fails
             return TextProcessor._fallback_split(text)
     
+    @staticmethod
+    def split_with_offsets(text: str) -> List[Tuple[str, int, int]]:
+        """
+        Split text into sentences along with their character offsets.
+        
+        Uses Punkt's span_tokenize directly, so offsets come from the
+        tokenizer instead of being searched for after splitting. Falls back
+        to split_sentences() + get_sentence_offsets() in the same cases
+        split_sentences() falls back to regex splitting.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            List of (sentence, start, end) with text[start:end] == sentence
+        """
+        if not text or text.isspace():
+            return []
+        
+        spans = []
+        if _PUNKT is not None:
+            try:
+                for start, end in _PUNKT.span_tokenize(text):
+                    # Narrow the span to the stripped sentence
+                    while start < end and text[start].isspace():
+                        start += 1
+                    while end > start and text[end - 1].isspace():
+                        end -= 1
+                    if start < end:
+                        spans.append((text[start:end], start, end))
+            except Exception:
+                spans = []
+            
+            # Same single-long-sentence check as split_sentences()
+            if len(spans) == 1 and spans[0][2] - spans[0][1] > 2000:
+                spans = []
+        
+        if not spans:
+            sentences = TextProcessor.split_sentences(text)
+            offsets = TextProcessor.get_sentence_offsets(text, sentences)
+            spans = [(sentence, start, end) for sentence, (start, end) in zip(sentences, offsets)]
+        
+        return spans
+    
     @staticmethod
     def get_sentence_offsets(text: str, sentences: List[str]) -> List[Tuple[int, int]]:
         """
@@ -87,11 +211,20 @@ class TextProcessor:
         """
         offsets = []
         search_start = 0
+        text_len = len(text)
         
         for sentence in sentences:
-            start = text.find(sentence, search_start)
-            if start == -1:
-                start = search_start
+            # Sentences come from the splitter in order, separated only by
+            # whitespace, so the next one normally starts after skipping it
+            while search_start < text_len and text[search_start].isspace():
+                search_start += 1
+            
+            start = search_start
+            if not text.startswith(sentence, start):
+                # Splitter altered the text; search for the sentence instead
+                start = text.find(sentence, search_start)
+                if start == -1:
+                    start = search_start
             
             end = start + len(sentence)
             offsets.append((start, end))
@@ -42,7 +42,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['pandas', 'openai', 'requests', 'tkinter', 'tkinter.ttk'],
+    hiddenimports=['pandas', 'openai', 'google.generativeai', 'requests', 'pypdfium2', 'PyPDF2', 'orjson', 'tiktoken', 'tiktoken_ext.openai_public', 'charset_normalizer', 'tkinter', 'tkinter.ttk'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
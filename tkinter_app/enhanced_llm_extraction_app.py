@@ -15,42 +15,278 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import pandas as pd
+import importlib.util
 import os
+import re
+import csv
+import functools
+import codecs
 import json
+import hashlib
+import sqlite3
 import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import queue
 import time
+import random
 import requests
+from requests.adapters import HTTPAdapter
+from collections import deque
 from abc import ABC, abstractmethod
 
-# Try to import optional dependencies
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+def _module_available(name: str) -> bool:
+    """Check that a module is installed without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        # A parent package (e.g. "google") is missing
+        return False
+
+# Optional dependencies. The heavy ones (pandas, provider SDKs, PDF and
+# tokenizer libraries) are only located here and imported where they are
+# used, so the window appears without waiting for them to load
+OPENAI_AVAILABLE = _module_available("openai")
+GENAI_AVAILABLE = _module_available("google.generativeai")
+PDFIUM_AVAILABLE = _module_available("pypdfium2")
+PDF_AVAILABLE = _module_available("PyPDF2")
+TIKTOKEN_AVAILABLE = _module_available("tiktoken")
+CHARSET_DETECTION_AVAILABLE = _module_available("charset_normalizer")
 
 try:
-    import PyPDF2
-    PDF_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # Configuration file for storing API keys and settings
 CONFIG_FILE = "app_config.json"
 
+# System prompt shared by all chat providers. Kept identical across requests
+# so providers with automatic prompt caching can reuse the prefix
+SYSTEM_PROMPT = "You are a research assistant specialized in data extraction. You carefully read the text you are given, extract the requested information from the text and you only respond in JSON format as instructed. You never make up data that is not present in the text."
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Extraction prompt up to the item text, which follows in triple backticks.
+# The text goes last so everything before it is a prefix shared by every
+# request in a run (reusable by provider prompt caching)
+EXTRACTION_PROMPT_TEMPLATE = (
+    "Extract information from the following text. Your task is to perform the following actions:\n"
+    "\n"
+    "1. Read the content of the text in its entirety\n"
+    "\n"
+    "2. Extract the following information:\n"
+    "\n"
+    "{fields_block}"
+    "3. Output your response as a JSON object in the following format:\n"
+    "\n"
+    "{json_schema}\n"
+    "\n"
+    "The text to analyze is delimited with triple backticks:\n"
+    "\n"
+)
+
+# Rows read per chunk when loading CSV data for processing
+CSV_CHUNK_ROWS = 256
+
+# Bytes sampled from the start of a CSV file to detect its encoding
+ENCODING_SAMPLE_BYTES = 65536
+
+# SQLite database for cached LLM responses
+CACHE_FILE = "llm_cache.sqlite"
+
+# Markdown code fence (```json ... ```) wrapped around a JSON response
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+
+# Runs of spaces/tabs, and whitespace around line breaks, in item text
+_SPACE_RUN = re.compile(r"[^\S\n]+")
+_LINE_BREAK_RUN = re.compile(r"\s*\n\s*")
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+def json_loads(data: str) -> Any:
+    """Parse a JSON string, with orjson when available (its errors subclass json.JSONDecodeError)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=None)
+def get_token_encoding():
+    """The cl100k_base tokenizer, loaded once; None if tiktoken or its data is unavailable"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        import tiktoken
+        # Downloads the BPE ranks on first use, so this can fail offline
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+def truncate_to_tokens(text: str, max_tokens: int, exact: bool = True) -> str:
+    """
+    Cut text down to at most max_tokens tokens.
+    
+    Counts with tiktoken when exact and available, otherwise approximates
+    4 characters per token (also used for non-OpenAI tokenizers like Gemini's).
+    """
+    # Every token covers at least one character
+    if len(text) <= max_tokens:
+        return text
+    
+    encoding = get_token_encoding() if exact else None
+    if encoding is None:
+        return text[:max_tokens * 4]
+    
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Canonical spacing for item text: single spaces, single line breaks,
+    and at most one blank line between paragraphs.
+    
+    Texts that differ only in spacing (re-exports, PDF layout noise) then
+    build identical prompts, so they share cache entries and requests.
+    """
+    text = _SPACE_RUN.sub(" ", text)
+    text = _LINE_BREAK_RUN.sub(lambda m: "\n\n" if m.group().count("\n") > 1 else "\n", text)
+    return text.strip()
+
+def extract_pdf_text(pdf_path: str) -> str:
+    """
+    Extract text from a PDF file.
+    
+    Uses PDFium (pypdfium2) when installed, which is much faster than
+    PyPDF2; PyPDF2 remains the fallback. Module-level so it can run in a
+    process pool.
+    """
+    try:
+        if PDFIUM_AVAILABLE:
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                pages = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    pages.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+            # PDFium separates lines with CRLF
+            text = "\n".join(pages).replace("\r\n", "\n")
+        else:
+            import PyPDF2
+            with open(pdf_path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                text = "\n".join(page.extract_text() for page in pdf_reader.pages)
+        return text.strip()
+    except Exception as e:
+        return f"Error extracting PDF: {str(e)}"
+
+# SQLite-backed cache of LLM responses
+class LLMCache:
+    """
+    Persistent response cache keyed by (provider, model, temperature, prompt).
+    
+    Also stores extracted values per (item, field) so re-runs only request
+    fields that haven't been extracted yet.
+    """
+    
+    def __init__(self, path: str = CACHE_FILE):
+        self._lock = threading.Lock()
+        # Shared by worker threads; access is serialized by the lock
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS extractions (item_key TEXT, field_key TEXT, item_id TEXT, "
+                "value TEXT, ts INTEGER, PRIMARY KEY (item_key, field_key))"
+            )
+    
+    @staticmethod
+    def make_key(provider: str, model: str, temperature: Optional[float], prompt: str) -> str:
+        return hashlib.sha256(f"{provider}|{model}|{temperature}|{prompt}".encode("utf-8")).hexdigest()
+    
+    def lookup(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def update(self, key: str, response: str):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, int(time.time()))
+            )
+    
+    def get_extractions(self, item_key: str) -> Dict[str, Any]:
+        """Stored field values for an item, keyed by field key"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT field_key, value FROM extractions WHERE item_key = ?", (item_key,)
+            ).fetchall()
+        return {field_key: json_loads(value) for field_key, value in rows}
+    
+    def store_extractions(self, item_key: str, item_id: str, values: Dict[str, Any]):
+        """Store extracted values for an item, keyed by field key"""
+        now = int(time.time())
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO extractions (item_key, field_key, item_id, value, ts) VALUES (?, ?, ?, ?, ?)",
+                [(item_key, field_key, item_id, json_dumps(value), now) for field_key, value in values.items()]
+            )
+    
+    def clear(self):
+        """Delete all cached responses and stored extractions"""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.execute("DELETE FROM extractions")
+
 # Base class for LLM providers
 class LLMProvider(ABC):
-    def __init__(self, model_name: str, api_key: Optional[str] = None, base_url: Optional[str] = None, temperature: Optional[float] = None):
+    # Label for error messages and cache keys
+    name = "LLM"
+    
+    def __init__(self, model_name: str, api_key: Optional[str] = None, base_url: Optional[str] = None, temperature: Optional[float] = None, cache: Optional[LLMCache] = None):
         self.model_name = model_name
         self.api_key = api_key
         self.base_url = base_url
         self.temperature = temperature
+        self.cache = cache
         self.setup_client()
     
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """Cache key for a prompt, or None if its response shouldn't be cached"""
+        # Sampled (temperature > 0) responses aren't reproducible, so don't cache them
+        if self.cache is None or (self.temperature or 0) > 0:
+            return None
+        return LLMCache.make_key(self.name, self.model_name, self.temperature, prompt)
+    
+    def get_cached(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a prompt, if any"""
+        key = self._cache_key(prompt)
+        cached = self.cache.lookup(key) if key else None
+        if cached is None:
+            return None
+        return {"response": cached, "time_taken": 0.0, "success": True, "cached": True}
+    
+    def cache_response(self, prompt: str, response: Dict[str, Any]):
+        """Store a response in the cache; callers only pass responses that parsed successfully"""
+        key = self._cache_key(prompt)
+        if key and response.get("success"):
+            self.cache.update(key, response["response"])
+    
     def _get_generation_params(self) -> Dict[str, Any]:
         """Get generation parameters, including temperature if supported"""
         params = {}
@@ -58,6 +294,22 @@ class LLMProvider(ABC):
             params["temperature"] = self.temperature
         return params
     
+    @staticmethod
+    def _is_rate_limited(error: Exception) -> bool:
+        """Check whether a provider error is an HTTP 429 / quota rejection"""
+        status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+        return status == 429 or type(error).__name__ in ("RateLimitError", "ResourceExhausted")
+    
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Check whether a provider error is a timeout, dropped connection or 5xx worth retrying"""
+        status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+        return status in (500, 502, 503, 504) or type(error).__name__ in (
+            "APITimeoutError", "APIConnectionError", "InternalServerError",  # OpenAI SDK
+            "DeadlineExceeded", "ServiceUnavailable",  # Google API core
+            "Timeout", "ReadTimeout", "ConnectTimeout", "ConnectionError",  # requests
+        )
+    
     @abstractmethod
     def setup_client(self):
         """Setup the client for the specific provider"""
@@ -68,27 +320,37 @@ class LLMProvider(ABC):
         """Generate response from the model"""
         pass
 
-# OpenAI Provider
-class OpenAIProvider(LLMProvider):
+# OpenAI, DeepSeek and Grok all serve the OpenAI chat completions API
+class OpenAICompatibleProvider(LLMProvider):
+    def __init__(self, model_name: str, api_key: Optional[str] = None, base_url: Optional[str] = None, temperature: Optional[float] = None, cache: Optional[LLMCache] = None, name: str = "OpenAI", extra_kwargs: Optional[Dict[str, Any]] = None, supports_json_mode: bool = True):
+        self.name = name
+        self.extra_kwargs = extra_kwargs or {}
+        if supports_json_mode:
+            # Have the API guarantee a JSON object instead of relying on the prompt
+            self.extra_kwargs.setdefault("response_format", {"type": "json_object"})
+        super().__init__(model_name, api_key, base_url=base_url, temperature=temperature, cache=cache)
+    
     def setup_client(self):
-        try:
-            from openai import OpenAI
-            self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
-        except ImportError:
+        if not OPENAI_AVAILABLE:
             raise ImportError("OpenAI library not installed. Please install: pip install openai")
+        # Only OpenAI's own endpoint can fall back to the OPENAI_API_KEY variable
+        if self.base_url and not self.api_key:
+            raise ValueError(f"{self.name} API key is required. Please set it when creating the provider.")
+        from openai import OpenAI
+        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
     
     def generate_response(self, prompt: str) -> Dict[str, Any]:
         start_time = time.time()
-        generation_params = self._get_generation_params()
         
         try:
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
-                    {"role": "system", "content": "You are a research assistant specialized in data extraction. You carefully read the text you are given, extract the requested information from the text and you only respond in JSON format as instructed. You never make up data that is not present in the text."},
+                    SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ],
-                **generation_params
+                **self.extra_kwargs,
+                **self._get_generation_params()
             )
             end_time = time.time()
             
@@ -99,20 +361,23 @@ class OpenAIProvider(LLMProvider):
             }
         except Exception as e:
             return {
-                "response": json.dumps({"error": f"OpenAI API error: {str(e)}"}),
+                "response": json_dumps({"error": f"{self.name} API error: {str(e)}"}),
                 "time_taken": time.time() - start_time,
-                "success": False
+                "success": False,
+                "rate_limited": self._is_rate_limited(e),
+                "transient": self._is_transient(e)
             }
 
 # Google Provider
 class GoogleProvider(LLMProvider):
+    name = "Google"
+    
     def setup_client(self):
-        try:
-            import google.generativeai as genai
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel(self.model_name)
-        except ImportError:
+        if not GENAI_AVAILABLE:
             raise ImportError("Google AI library not installed. Please install: pip install google-generativeai")
+        import google.generativeai as genai
+        genai.configure(api_key=self.api_key)
+        self.model = genai.GenerativeModel(self.model_name)
     
     def generate_response(self, prompt: str) -> Dict[str, Any]:
         start_time = time.time()
@@ -121,7 +386,7 @@ class GoogleProvider(LLMProvider):
         try:
             response = self.model.generate_content(
                 prompt,
-                generation_config=generation_params
+                generation_config={"response_mime_type": "application/json", **generation_params}
             )
             end_time = time.time()
             
@@ -132,127 +397,38 @@ class GoogleProvider(LLMProvider):
             }
         except Exception as e:
             return {
-                "response": json.dumps({"error": f"Google API error: {str(e)}"}),
+                "response": json_dumps({"error": f"Google API error: {str(e)}"}),
                 "time_taken": time.time() - start_time,
-                "success": False
-            }
-
-# DeepSeek Provider (using OpenAI-compatible API)
-class DeepSeekProvider(LLMProvider):
-    def setup_client(self):
-        try:
-            from openai import OpenAI
-            if not self.api_key:
-                raise ValueError("DeepSeek API key is required. Please set it when creating the provider.")
-            self.client = OpenAI(
-                api_key=self.api_key,
-                base_url=self.base_url or "https://api.deepseek.com/v1"
-            )
-        except ImportError:
-            raise ImportError("OpenAI library not installed. Please install: pip install openai")
-    
-    def generate_response(self, prompt: str) -> Dict[str, Any]:
-        start_time = time.time()
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "You are a research assistant specialized in data extraction. You carefully read the text you are given, extract the requested information from the text and you only respond in JSON format as instructed. You never make up data that is not present in the text."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature
-            )
-            end_time = time.time()
-            
-            return {
-                "response": response.choices[0].message.content,
-                "time_taken": end_time - start_time,
-                "success": True
-            }
-        except Exception as e:
-            return {
-                "response": json.dumps({"error": f"DeepSeek API error: {str(e)}"}),
-                "time_taken": time.time() - start_time,
-                "success": False
-            }
-
-# Grok Provider
-class GrokProvider(LLMProvider):
-    def setup_client(self):
-        try:
-            from openai import OpenAI
-            if not self.api_key:
-                raise ValueError("Grok API key is required. Please set it when creating the provider.")
-            self.client = OpenAI(
-                api_key=self.api_key,
-                base_url="https://api.x.ai/v1"
-            )
-        except ImportError:
-            raise ImportError("OpenAI library not installed. Please install: pip install openai")
-    
-    def generate_response(self, prompt: str) -> Dict[str, Any]:
-        start_time = time.time()
-        
-        try:
-            generation_params = self._get_generation_params()
-            
-            # Special handling for Grok reasoning models
-            if "grok-3" in self.model_name.lower():
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    reasoning_effort="high",
-                    messages=[
-                        {"role": "system", "content": "You are a research assistant specialized in data extraction. You carefully read the text you are given, extract the requested information from the text and you only respond in JSON format as instructed. You never make up data that is not present in the text."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    **generation_params
-                )
-            else:
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[
-                        {"role": "system", "content": "You are a research assistant specialized in data extraction. You carefully read the text you are given, extract the requested information from the text and you only respond in JSON format as instructed. You never make up data that is not present in the text."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    **generation_params
-                )
-            
-            end_time = time.time()
-            
-            return {
-                "response": response.choices[0].message.content,
-                "time_taken": end_time - start_time,
-                "success": True
-            }
-            
-        except Exception as e:
-            return {
-                "response": json.dumps({"error": f"Grok API error: {str(e)}"}),
-                "time_taken": time.time() - start_time,
-                "success": False
+                "success": False,
+                "rate_limited": self._is_rate_limited(e),
+                "transient": self._is_transient(e)
             }
 
 # Ollama Provider
 class OllamaProvider(LLMProvider):
+    name = "Ollama"
+    
     def setup_client(self):
-        try:
-            import requests
-            self.base_url = self.base_url or "http://localhost:11434"
-        except ImportError:
-            raise ImportError("Requests library not installed. Please install: pip install requests")
+        self.base_url = self.base_url or "http://localhost:11434"
+        
+        # Keep-alive connection pool shared by worker threads. No retries here:
+        # generate_with_rate_limit retries transient failures, so they don't stack
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def generate_response(self, prompt: str) -> Dict[str, Any]:
         start_time = time.time()
         
         try:
-            import requests
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model_name,
                     "prompt": prompt,
                     "stream": False,
+                    "format": "json",
                     "temperature": self.temperature
                 }
             )
@@ -266,11 +442,77 @@ class OllamaProvider(LLMProvider):
             }
         except Exception as e:
             return {
-                "response": json.dumps({"error": f"Ollama API error: {str(e)}"}),
+                "response": json_dumps({"error": f"Ollama API error: {str(e)}"}),
                 "time_taken": time.time() - start_time,
-                "success": False
+                "success": False,
+                "rate_limited": self._is_rate_limited(e),
+                "transient": self._is_transient(e)
             }
 
+# Default (requests per minute, tokens per minute) budgets per provider
+RATE_LIMITS = {
+    "OpenAI": (60, 150_000),
+    "Google": (60, 100_000),
+    "DeepSeek": (60, 150_000),
+    "Grok": (60, 150_000),
+    "Ollama": (1000, 10_000_000),
+}
+
+# Attempts per request when the provider answers with a rate-limit or transient error
+REQUEST_ATTEMPTS = 5
+
+# Shared rate limiter for parallel provider calls
+class RateLimiter:
+    """
+    Sliding-window RPM/TPM limiter with AIMD concurrency control.
+    
+    Worker threads call acquire() before each request and release() after it.
+    A rate-limited response halves the allowed concurrency; each successful
+    one grows it back additively, up to max_concurrent.
+    """
+    
+    def __init__(self, rpm: int, tpm: int, max_concurrent: int, window: float = 60.0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window = window
+        self.max_concurrent = max_concurrent
+        self.concurrency = float(max_concurrent)
+        self._in_flight = 0
+        self._calls = deque()  # (timestamp, tokens) of requests inside the window
+        self._window_tokens = 0
+        self._cond = threading.Condition()
+    
+    def acquire(self, tokens: int):
+        """Block until a request of roughly `tokens` tokens may be sent"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0][0] >= self.window:
+                    self._window_tokens -= self._calls.popleft()[1]
+                
+                window_full = len(self._calls) >= self.rpm or (
+                    bool(self._calls) and self._window_tokens + tokens > self.tpm
+                )
+                if not window_full and self._in_flight < int(self.concurrency):
+                    break
+                
+                # Window limits free up as the oldest call ages out; concurrency on release()
+                self._cond.wait(self._calls[0][0] + self.window - now if window_full else None)
+            
+            self._calls.append((now, tokens))
+            self._window_tokens += tokens
+            self._in_flight += 1
+    
+    def release(self, rate_limited: bool = False):
+        """Finish a request and adapt concurrency to whether it was rate limited"""
+        with self._cond:
+            self._in_flight -= 1
+            if rate_limited:
+                self.concurrency = max(1.0, self.concurrency * 0.5)
+            else:
+                self.concurrency = min(float(self.max_concurrent), self.concurrency + 1.0 / self.concurrency)
+            self._cond.notify_all()
+
 class LLMExtractionApp:
     def __init__(self, root):
         self.root = root
@@ -285,8 +527,22 @@ class LLMExtractionApp:
         self.file_path = ""
         self.folder_path = ""
         self.csv_columns = []
-        self.categorical_fields = []  # List of {"name": str, "prompt": str, "expected_values": list}
+        self.csv_encoding = None  # Encoding that worked when reading the CSV header
+        self.categorical_fields = []  # List of {"name": str, "prompt": str, "expected_values": list, "resolved_prompt": str, "allowed_values": frozenset}
         self.processing = False
+        self.response_cache = None  # LLMCache, opened on first use
+        
+        # Request progress, counted by the processing thread and shown by _tick
+        self._completed = 0
+        self._total = 0
+        self._last_item = ""
+        self._shown = None
+        self._ui_lock = threading.Lock()
+        
+        # Latest status/progress from worker threads, applied by _flush_ui
+        self._pending_status = None
+        self._pending_progress = None
+        self._flush_scheduled = False
         
         # Model configurations
         self.model_configs = {
@@ -456,6 +712,16 @@ class LLMExtractionApp:
         ttk.Checkbutton(prompt_options_frame, text="Save prompts with results", 
                        variable=self.save_prompts_var).pack(anchor=tk.W)
         
+        self.force_reextract_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(prompt_options_frame, text="Force re-extract all fields (ignore values stored by earlier runs)", 
+                       variable=self.force_reextract_var).pack(anchor=tk.W)
+        
+        # Off by default: normalized texts build different prompts, so cache
+        # entries and stored values from runs without it aren't reused
+        self.normalize_whitespace_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(prompt_options_frame, text="Normalize whitespace in texts (texts differing only in spacing share cached results)", 
+                       variable=self.normalize_whitespace_var).pack(anchor=tk.W)
+        
         self.truncate_text_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(prompt_options_frame, text="Truncate long text in saved prompts (recommended for PDFs)", 
                        variable=self.truncate_text_var).pack(anchor=tk.W)
@@ -514,6 +780,47 @@ class LLMExtractionApp:
                                   textvariable=self.temperature_var, width=10)
         temp_spinbox.pack(side=tk.LEFT, padx=(5, 0))
         
+        # Parallel requests
+        workers_frame = ttk.Frame(model_frame)
+        workers_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        ttk.Label(workers_frame, text="Parallel requests:").pack(side=tk.LEFT)
+        self.workers_var = tk.IntVar(value=8)
+        ttk.Spinbox(workers_frame, from_=1, to=32, textvariable=self.workers_var, 
+                   width=10).pack(side=tk.LEFT, padx=(5, 0))
+        
+        rpm_frame = ttk.Frame(model_frame)
+        rpm_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        ttk.Label(rpm_frame, text="Max requests per minute (0 = provider default):").pack(side=tk.LEFT)
+        self.max_rpm_var = tk.IntVar(value=0)
+        ttk.Spinbox(rpm_frame, from_=0, to=100000, increment=10, textvariable=self.max_rpm_var, 
+                   width=10).pack(side=tk.LEFT, padx=(5, 0))
+        
+        tokens_frame = ttk.Frame(model_frame)
+        tokens_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        ttk.Label(tokens_frame, text="Max input tokens per item (longer text is truncated):").pack(side=tk.LEFT)
+        self.max_input_tokens_var = tk.IntVar(value=100000)
+        ttk.Spinbox(tokens_frame, from_=1000, to=1000000, increment=1000, textvariable=self.max_input_tokens_var, 
+                   width=10).pack(side=tk.LEFT, padx=(5, 0))
+        
+        fields_frame = ttk.Frame(model_frame)
+        fields_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        ttk.Label(fields_frame, text="Max fields per request:").pack(side=tk.LEFT)
+        self.fields_per_call_var = tk.IntVar(value=10)
+        ttk.Spinbox(fields_frame, from_=1, to=50, textvariable=self.fields_per_call_var, 
+                   width=10).pack(side=tk.LEFT, padx=(5, 0))
+        
+        cache_frame = ttk.Frame(model_frame)
+        cache_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        self.cache_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(cache_frame, text="Enable response cache (reuses answers for identical prompts at temperature 0)", 
+                       variable=self.cache_var).pack(side=tk.LEFT)
+        ttk.Button(cache_frame, text="Clear Cache", command=self.clear_cache).pack(side=tk.RIGHT)
+        
         # Output Configuration Section
         output_frame = ttk.LabelFrame(scrollable_frame, text="Output Configuration", padding="10")
         output_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -527,6 +834,16 @@ class LLMExtractionApp:
         ttk.Entry(output_dir_frame, textvariable=self.output_dir_var, state="readonly").pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(output_dir_frame, text="Browse", command=self.browse_output_dir).pack(side=tk.RIGHT)
         
+        # Results file of an interrupted run to continue
+        resume_frame = ttk.Frame(output_frame)
+        resume_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(resume_frame, text="Resume From Results File (optional; items already extracted are skipped):").pack(anchor=tk.W)
+        self.resume_file_var = tk.StringVar(value="")
+        ttk.Entry(resume_frame, textvariable=self.resume_file_var, state="readonly").pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(resume_frame, text="Clear", command=lambda: self.resume_file_var.set("")).pack(side=tk.RIGHT)
+        ttk.Button(resume_frame, text="Browse", command=self.browse_resume_file).pack(side=tk.RIGHT)
+        
         # Processing Section
         process_frame = ttk.LabelFrame(scrollable_frame, text="Processing", padding="10")
         process_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -573,21 +890,16 @@ class LLMExtractionApp:
     
     def load_csv_columns(self):
         """Load CSV columns for selection"""
+        import pandas as pd
+        
         try:
-            # Try multiple encodings
-            encodings = ['utf-8-sig', 'utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-            df = None
+            self.csv_encoding = self.detect_csv_encoding()
             
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(self.file_path, encoding=encoding, nrows=0)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if df is None:
+            try:
+                df = pd.read_csv(self.file_path, encoding=self.csv_encoding, nrows=0)
+            except UnicodeDecodeError:
                 # Last resort - read with error replacement
-                df = pd.read_csv(self.file_path, encoding='utf-8', errors='replace', nrows=0)
+                df = pd.read_csv(self.file_path, encoding=self.csv_encoding, encoding_errors='replace', nrows=0)
             
             # Clean column names (remove BOM if present)
             df.columns = [col.replace('\ufeff', '') for col in df.columns]
@@ -607,6 +919,31 @@ class LLMExtractionApp:
         except Exception as e:
             messagebox.showerror("Error", f"Error loading CSV file: {str(e)}")
     
+    def detect_csv_encoding(self) -> str:
+        """Guess the CSV file's encoding from a sample at the start of the file"""
+        with open(self.file_path, 'rb') as f:
+            sample = f.read(ENCODING_SAMPLE_BYTES)
+        
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'utf-16'
+        
+        try:
+            # Incremental decode so a character cut off at the end of the sample isn't an error
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        if CHARSET_DETECTION_AVAILABLE:
+            from charset_normalizer import from_bytes
+            best = from_bytes(sample).best()
+            if best is not None:
+                return best.encoding
+        
+        return 'latin-1'
+    
     def add_category(self):
         """Add a new categorical field"""
         name = self.category_name_entry.get().strip()
@@ -630,7 +967,11 @@ class LLMExtractionApp:
         self.categorical_fields.append({
             "name": name,
             "prompt": prompt,
-            "expected_values": expected_values
+            "expected_values": expected_values,
+            # Prompt with the placeholder filled in, so runs don't redo the substitution
+            "resolved_prompt": prompt.replace("[CATEGORY_NAME]", name),
+            # Values a response may contain, for validating results; empty means anything goes
+            "allowed_values": frozenset(expected_values + ["NA"]) if expected_values else frozenset()
         })
         
         self.update_categories_display()
@@ -698,6 +1039,24 @@ class LLMExtractionApp:
             self.category_details.delete("1.0", tk.END)
             self.category_details.config(state=tk.DISABLED)
     
+    def clear_cache(self):
+        """Delete cached responses and stored extractions"""
+        if self.processing:
+            messagebox.showwarning("Processing", "Cannot clear the cache while processing is in progress")
+            return
+        
+        if not messagebox.askyesno("Confirm", "Delete all cached responses and stored extractions?"):
+            return
+        
+        if self.response_cache is None:
+            if not os.path.exists(CACHE_FILE):
+                messagebox.showinfo("Cache", "The cache is already empty")
+                return
+            self.response_cache = LLMCache(CACHE_FILE)
+        
+        self.response_cache.clear()
+        messagebox.showinfo("Cache", "Cache cleared")
+    
     def on_provider_change(self, event=None):
         """Handle provider selection change"""
         provider = self.provider_var.get()
@@ -733,49 +1092,43 @@ class LLMExtractionApp:
         if directory:
             self.output_dir_var.set(directory)
     
-    def construct_extraction_prompt(self, text: str) -> str:
-        """Construct the extraction prompt with all categorical fields"""
-        if not self.categorical_fields:
+    def browse_resume_file(self):
+        """Browse for the results file of an interrupted run"""
+        file_path = filedialog.askopenfilename(
+            title="Select Results File to Resume",
+            initialdir=self.output_dir_var.get(),
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if file_path:
+            self.resume_file_var.set(file_path)
+    
+    def construct_extraction_prompt(self, text: str, fields: Optional[List[Dict[str, Any]]] = None) -> str:
+        """Construct the extraction prompt for the given categorical fields (default: all)"""
+        if fields is None:
+            fields = self.categorical_fields
+        if not fields:
             return ""
         
-        # Build the prompt sections
-        prompt_parts = []
-        prompt_parts.append("Extract information from the following text. Your task is to perform the following actions:")
-        prompt_parts.append("")
-        prompt_parts.append("1. Read the content of the text in its entirety")
-        prompt_parts.append("")
-        prompt_parts.append("2. Extract the following information:")
-        prompt_parts.append("")
-        
-        # Add each categorical field
-        for i, field in enumerate(self.categorical_fields, 1):
-            field_prompt = field["prompt"].replace("[CATEGORY_NAME]", field["name"])
-            prompt_parts.append(f"   Field {i} - {field['name']}: {field_prompt}")
-            
-            if field["expected_values"]:
-                expected_str = '", "'.join(field["expected_values"])
-                prompt_parts.append(f"   Expected values: [\"{expected_str}\", \"NA\"]")
-            
-            prompt_parts.append("")
-        
-        prompt_parts.append("3. Output your response as a JSON object in the following format:")
-        
-        # Build JSON structure
+        return self.construct_prompt_prefix(fields) + f"```{text}```"
+    
+    def construct_prompt_prefix(self, fields: List[Dict[str, Any]]) -> str:
+        """Build the part of the extraction prompt that precedes the text, which is the same for every item"""
+        fields_block = []
         json_structure = {}
-        for field in self.categorical_fields:
+        for i, field in enumerate(fields, 1):
+            fields_block.append(f"   Field {i} - {field['name']}: {field['resolved_prompt']}\n")
             if field["expected_values"]:
+                expected_str = '", "'.join(field["expected_values"])
+                fields_block.append(f"   Expected values: [\"{expected_str}\", \"NA\"]\n")
                 json_structure[field["name"]] = f"RETURN ONLY ITEMS FROM THE LIST {field['expected_values'] + ['NA']}"
             else:
                 json_structure[field["name"]] = f"Extracted {field['name']} or 'NA' if not found"
+            fields_block.append("\n")
         
-        prompt_parts.append("")
-        prompt_parts.append(json.dumps(json_structure, indent=2))
-        prompt_parts.append("")
-        prompt_parts.append("The text to analyze is delimited with triple backticks:")
-        prompt_parts.append("")
-        prompt_parts.append(f"```{text}```")
-        
-        return "\n".join(prompt_parts)
+        return EXTRACTION_PROMPT_TEMPLATE.format(
+            fields_block="".join(fields_block),
+            json_schema=json.dumps(json_structure, indent=2)
+        )
     
     def get_llm_provider(self):
         """Get the configured LLM provider"""
@@ -786,28 +1139,32 @@ class LLMExtractionApp:
         api_key = self.api_key_entry.get() if self.model_configs[provider_name]["requires_api_key"] else None
         temperature = self.temperature_var.get()
         
+        cache = None
+        if self.cache_var.get():
+            if self.response_cache is None:
+                self.response_cache = LLMCache(CACHE_FILE)
+            cache = self.response_cache
+        
         if provider_name == "OpenAI":
-            return OpenAIProvider(model_name, api_key, temperature=temperature)
+            return OpenAICompatibleProvider(model_name, api_key, temperature=temperature, cache=cache)
         elif provider_name == "Google":
-            return GoogleProvider(model_name, api_key, temperature=temperature)
+            return GoogleProvider(model_name, api_key, temperature=temperature, cache=cache)
         elif provider_name == "DeepSeek":
-            return DeepSeekProvider(model_name, api_key, temperature=temperature)
+            return OpenAICompatibleProvider(model_name, api_key, base_url="https://api.deepseek.com/v1", 
+                                            temperature=temperature, cache=cache, name="DeepSeek")
         elif provider_name == "Grok":
-            return GrokProvider(model_name, api_key, temperature=temperature)
+            # Grok 3 reasoning models take an effort level. JSON mode isn't
+            # guaranteed on x.ai, so Grok relies on the prompt alone
+            extra_kwargs = {"reasoning_effort": "high"} if "grok-3" in model_name.lower() else {}
+            return OpenAICompatibleProvider(model_name, api_key, base_url="https://api.x.ai/v1", 
+                                            temperature=temperature, cache=cache, name="Grok", extra_kwargs=extra_kwargs,
+                                            supports_json_mode=False)
         else:
             raise ValueError(f"Unknown provider: {provider_name}")
     
     def extract_pdf_text(self, pdf_path: str) -> str:
         """Extract text from PDF file"""
-        try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
-        except Exception as e:
-            return f"Error extracting PDF: {str(e)}"
+        return extract_pdf_text(pdf_path)
     
     def validate_inputs(self):
         """Validate all inputs before processing"""
@@ -821,6 +1178,8 @@ class LLMExtractionApp:
         else:
             if not self.folder_path:
                 return "Please select a folder with PDF files"
+            if not (PDFIUM_AVAILABLE or PDF_AVAILABLE):
+                return "Reading PDF files requires pypdfium2 or PyPDF2. Please install: pip install pypdfium2"
         
         if not self.categorical_fields:
             return "Please add at least one categorical field"
@@ -835,6 +1194,9 @@ class LLMExtractionApp:
         if self.model_configs[provider_name]["requires_api_key"] and not self.api_key_entry.get():
             return f"Please enter {provider_name} API key"
         
+        if self.resume_file_var.get() and not os.path.isfile(self.resume_file_var.get()):
+            return "The results file to resume from no longer exists"
+        
         return None
     
     def start_processing(self):
@@ -858,10 +1220,30 @@ class LLMExtractionApp:
         self.processing = True
         self.process_button.config(state=tk.DISABLED)
         
+        with self._ui_lock:
+            self._completed, self._total, self._shown = 0, 0, None
+        self.root.after(100, self._tick)
+        
         # Start processing thread
         thread = threading.Thread(target=self.process_data, daemon=True)
         thread.start()
     
+    def _tick(self):
+        """Show request progress, polled from the Tk thread while processing runs"""
+        if not self.processing:
+            return
+        
+        with self._ui_lock:
+            completed, total, last_item = self._completed, self._total, self._last_item
+        
+        # Only redraw when something finished since the last tick
+        if total and completed != self._shown:
+            self._shown = completed
+            self.status_label.config(text=f"Processed request {completed}/{total}: {last_item}")
+            self.progress_var.set((completed / total) * 100)
+        
+        self.root.after(100, self._tick)
+    
     def process_data(self):
         """Process the data (runs in separate thread)"""
         try:
@@ -874,71 +1256,257 @@ class LLMExtractionApp:
             else:
                 data_items = self.load_pdf_data()
             
+            # When resuming, items that already have a successful row are skipped
+            # and new rows are appended to the earlier results
+            fieldnames = self.results_fieldnames()
+            resume_path = self.resume_file_var.get()
+            if resume_path:
+                output_path = resume_path
+                data_items = self.prepare_resume(resume_path, fieldnames, data_items)
+            else:
+                output_path = self.results_output_path()
+            
             total_items = len(data_items)
             if total_items == 0:
-                self.update_status("No data to process")
+                self.update_status("All items are already processed" if resume_path else "No data to process")
                 return
             
-            results = []
+            # Optionally normalize spacing so near-identical texts hit the same cache
+            # entries, then cut texts to the token budget up front rather than letting
+            # the provider reject oversized requests after a full round trip
+            normalize = self.normalize_whitespace_var.get()
+            max_input_tokens = max(1, self.max_input_tokens_var.get())
+            exact_tokens = not isinstance(provider, GoogleProvider)
+            for item in data_items:
+                text = normalize_whitespace(item['text']) if normalize else item['text']
+                item['text'] = truncate_to_tokens(text, max_input_tokens, exact_tokens)
             
-            # Process each item
-            for i, item in enumerate(data_items):
-                self.update_status(f"Processing item {i+1}/{total_items}: {item['id']}")
-                self.update_progress((i / total_items) * 100)
-                
-                # Construct prompt
-                prompt = self.construct_extraction_prompt(item['text'])
+            max_workers = max(1, self.workers_var.get())
+            rpm, tpm = RATE_LIMITS.get(self.provider_var.get(), RATE_LIMITS["OpenAI"])
+            rpm = self.max_rpm_var.get() or rpm
+            limiter = RateLimiter(rpm, tpm, max_concurrent=max_workers)
+            
+            store = self.extraction_store(provider)
+            field_keys = {field['name']: self.field_key(field) for field in self.categorical_fields}
+            fields_per_call = max(1, self.fields_per_call_var.get())
+            
+            # Plan the requests for each item. Fields already extracted for the same
+            # text, model and field definition are reused, and the rest go in one
+            # request per item, or several if there are more than fields_per_call
+            plans = []  # (item, item_key, known values, field groups)
+            for item in data_items:
+                item_key, known = None, {}
+                if store is not None:
+                    item_key = LLMCache.make_key(provider.name, provider.model_name, provider.temperature, item['text'])
+                    stored = store.get_extractions(item_key)
+                    # Values outside a field's expected list are requested again, not reused
+                    known = {
+                        field['name']: stored[field_keys[field['name']]] for field in self.categorical_fields
+                        if field_keys[field['name']] in stored and self.is_valid_value(field, stored[field_keys[field['name']]])
+                    }
                 
-                # Get LLM response
-                response = provider.generate_response(prompt)
+                missing = [field for field in self.categorical_fields if field['name'] not in known]
+                groups = [missing[i:i + fields_per_call] for i in range(0, len(missing), fields_per_call)]
+                plans.append((item, item_key, known, groups))
+            
+            total_requests = sum(len(groups) for _, _, _, groups in plans)
+            with self._ui_lock:
+                self._completed, self._total = 0, total_requests
+            
+            # The prompt up to the text only depends on the fields, so build it once per field group
+            prompt_prefixes = {}
+            self.update_status(f"Processing {total_items} items ({max_workers} parallel requests)...")
+            
+            # Items still waiting on requests, and their partially merged results
+            pending = [len(groups) for _, _, _, groups in plans]
+            partial_results = {}
+            written = 0
+            
+            with open(output_path, 'a' if resume_path else 'w', newline='', encoding='utf-8') as output_file:
+                # Each item is written as soon as all its requests finish, so
+                # results are kept even if the run is interrupted
+                writer = csv.DictWriter(output_file, fieldnames=fieldnames, restval='')
+                if not resume_path:
+                    writer.writeheader()
                 
-                # Parse response
-                result = self.parse_llm_response(item['id'], response, item.get('file_path', ''), prompt)
-                results.append(result)
+                # LLM calls are network-bound, so send them concurrently
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # Rows with the same text and fields build the same prompt,
+                    # so each distinct prompt is sent once and shared by its rows
+                    submitted = {}  # prompt -> future
+                    futures = {}  # future -> [(i, item, fields, prompt)]
+                    for i, (item, _, known, groups) in enumerate(plans):
+                        if not groups:
+                            # Every field is already stored, no request needed
+                            writer.writerow(self.stored_result(item, known))
+                            written += 1
+                            continue
+                        
+                        for fields in groups:
+                            group_names = tuple(field['name'] for field in fields)
+                            if group_names not in prompt_prefixes:
+                                prompt_prefixes[group_names] = self.construct_prompt_prefix(fields)
+                            prompt = prompt_prefixes[group_names] + f"```{item['text']}```"
+                            future = submitted.get(prompt)
+                            if future is None:
+                                future = executor.submit(self.generate_with_rate_limit, provider, limiter, prompt)
+                                submitted[prompt] = future
+                                futures[future] = []
+                            futures[future].append((i, item, fields, prompt))
+                    
+                    # Parse responses as they arrive, once for every row sharing the request.
+                    # If anything here fails, cancel the queued requests instead of
+                    # waiting for (and paying for) results that would be discarded
+                    try:
+                        for future in as_completed(futures):
+                            response = future.result()
+                            needs_caching = not response.get('cached', False)
+                            for i, item, fields, prompt in futures[future]:
+                                _, item_key, known, _ = plans[i]
+                                result = self.parse_llm_response(item['id'], response, item.get('file_path', ''), prompt, fields)
+                                
+                                # Only replies that parsed into a JSON object are cached, so
+                                # prose or truncated answers are requested again next time
+                                parsed = result['success'] and 'json_error' not in result
+                                if parsed and needs_caching:
+                                    provider.cache_response(prompt, response)
+                                    needs_caching = False
+                                
+                                if store is not None and parsed:
+                                    # Only values that passed validation are reused by later runs
+                                    store.store_extractions(item_key, item['id'], {
+                                        field_keys[field['name']]: result[field['name']] for field in fields
+                                        if self.is_valid_value(field, result[field['name']])
+                                    })
+                                
+                                if i in partial_results:
+                                    self.merge_results(partial_results[i], result)
+                                else:
+                                    partial_results[i] = result
+                                
+                                pending[i] -= 1
+                                if pending[i] == 0:
+                                    row = partial_results.pop(i)
+                                    row.update(known)
+                                    writer.writerow(row)
+                                    output_file.flush()
+                                    written += 1
+                                
+                                # Just count here; _tick redraws at most every 100 ms
+                                # instead of queueing a Tk update per completion
+                                with self._ui_lock:
+                                    self._completed += 1
+                                    self._last_item = item['id']
+                    except BaseException:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
             
-            # Save results
-            self.save_results(results)
-            self.update_status(f"Processing completed! {len(results)} items processed.")
+            self.finish_progress()
+            # The resumed run is complete; the next run starts a new file
+            self.root.after(0, lambda: self.resume_file_var.set(""))
+            self.update_status(f"Processing completed! {written} items processed. Results saved to: {output_path}")
             self.update_progress(100)
             
             messagebox.showinfo("Success", f"Processing completed successfully!\nResults saved to output directory.")
             
         except Exception as e:
+            self.finish_progress()
             self.update_status(f"Error: {str(e)}")
             messagebox.showerror("Processing Error", f"An error occurred during processing:\n{str(e)}")
         finally:
             self.processing = False
             self.process_button.config(state=tk.NORMAL)
     
+    def extraction_store(self, provider: LLMProvider) -> Optional[LLMCache]:
+        """Where extracted field values are stored for reuse, or None to re-extract every field"""
+        # Same rule as the response cache: only reproducible (temperature 0) results are reused
+        if provider.cache is None or self.force_reextract_var.get() or (provider.temperature or 0) > 0:
+            return None
+        return provider.cache
+    
+    @staticmethod
+    def field_key(field: Dict[str, Any]) -> str:
+        """Identity of a field definition; editing its prompt or expected values changes it"""
+        definition = json_dumps([field['name'], field['prompt'], field['expected_values']])
+        return hashlib.sha256(definition.encode('utf-8')).hexdigest()
+    
+    def stored_result(self, item: Dict[str, str], known: Dict[str, Any]) -> Dict[str, Any]:
+        """Result row for an item whose fields were all extracted by earlier runs"""
+        result = {
+            'ID': item['id'],
+            'model': f"{self.provider_var.get()}_{self.model_var.get()}",
+            'processing_time': 0,
+            'success': True
+        }
+        if item.get('file_path'):
+            result['file_path'] = item['file_path']
+        result.update(known)
+        return result
+    
+    def generate_with_rate_limit(self, provider: LLMProvider, limiter: RateLimiter, prompt: str) -> Dict[str, Any]:
+        """Call the provider within the rate limits, retrying rate-limited and transient failures with backoff"""
+        # Cache hits don't touch the network, so they skip the limiter
+        cached = provider.get_cached(prompt)
+        if cached is not None:
+            return cached
+        
+        est_tokens = len(prompt) // 4 + 1  # ~4 characters per token
+        
+        for attempt in range(REQUEST_ATTEMPTS):
+            limiter.acquire(est_tokens)
+            response = provider.generate_response(prompt)
+            # Only rate limiting shrinks concurrency; timeouts and 5xx are just retried
+            rate_limited = response.get("rate_limited", False)
+            limiter.release(rate_limited)
+            
+            retryable = rate_limited or response.get("transient", False)
+            if not retryable or attempt == REQUEST_ATTEMPTS - 1:
+                return response
+            
+            # Exponential backoff with jitter so workers don't retry in lockstep
+            time.sleep(min(60, 2 ** attempt) * random.uniform(0.5, 1.5))
+    
     def load_csv_data(self):
-        """Load data from CSV file"""
-        # Try multiple encodings
+        """Load the ID and text columns from the CSV file"""
+        id_col = self.id_column_var.get()
+        text_col = self.text_column_var.get()
+        
+        # Use the detected encoding, falling back to common ones if the
+        # rest of the file doesn't match the sample it was detected from
         encodings = ['utf-8-sig', 'utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        df = None
+        if self.csv_encoding:
+            encodings = [self.csv_encoding] + [e for e in encodings if e != self.csv_encoding]
         
         for encoding in encodings:
             try:
-                df = pd.read_csv(self.file_path, encoding=encoding)
-                break
+                return self.read_csv_items(id_col, text_col, encoding=encoding)
             except UnicodeDecodeError:
                 continue
         
-        if df is None:
-            # Last resort
-            df = pd.read_csv(self.file_path, encoding='utf-8', errors='replace')
-        
-        # Clean column names
-        df.columns = [col.replace('\ufeff', '') for col in df.columns]
-        
-        id_col = self.id_column_var.get()
-        text_col = self.text_column_var.get()
+        # Last resort
+        return self.read_csv_items(id_col, text_col, encoding='utf-8', encoding_errors='replace')
+    
+    def read_csv_items(self, id_col: str, text_col: str, **read_kwargs) -> List[Dict[str, str]]:
+        """Read (id, text) items in chunks, parsing only the two selected columns"""
+        import pandas as pd
         
+        wanted = {id_col, text_col}
         data_items = []
-        for _, row in df.iterrows():
-            data_items.append({
-                'id': str(row[id_col]),
-                'text': str(row[text_col])
-            })
+        
+        with pd.read_csv(
+            self.file_path,
+            usecols=lambda col: col.replace('\ufeff', '') in wanted,
+            dtype=str,
+            chunksize=CSV_CHUNK_ROWS,
+            **read_kwargs
+        ) as reader:
+            for chunk in reader:
+                # Clean column names (remove BOM if present)
+                chunk.columns = [col.replace('\ufeff', '') for col in chunk.columns]
+                data_items.extend(
+                    {'id': str(item_id), 'text': str(text)}
+                    for item_id, text in zip(chunk[id_col], chunk[text_col])
+                )
         
         return data_items
     
@@ -946,11 +1514,17 @@ class LLMExtractionApp:
         """Load data from PDF files"""
         data_items = []
         pdf_files = [f for f in os.listdir(self.folder_path) if f.lower().endswith('.pdf')]
+        pdf_paths = [os.path.join(self.folder_path, pdf_file) for pdf_file in pdf_files]
         
-        for pdf_file in pdf_files:
-            pdf_path = os.path.join(self.folder_path, pdf_file)
-            text = self.extract_pdf_text(pdf_path)
-            
+        # PDF parsing is CPU-bound, so spread it across processes
+        texts = [None] * len(pdf_paths)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = {pool.submit(extract_pdf_text, pdf_path): i for i, pdf_path in enumerate(pdf_paths)}
+            for done, future in enumerate(as_completed(futures), 1):
+                texts[futures[future]] = future.result()
+                self.update_status(f"Extracted text from {done}/{len(pdf_paths)} PDFs")
+        
+        for pdf_file, pdf_path, text in zip(pdf_files, pdf_paths, texts):
             data_items.append({
                 'id': os.path.splitext(pdf_file)[0],  # Use filename without extension as ID
                 'text': text,
@@ -959,8 +1533,12 @@ class LLMExtractionApp:
         
         return data_items
     
-    def parse_llm_response(self, item_id: str, response: Dict[str, Any], file_path: str = "", prompt: str = ""):
-        """Parse LLM response and extract categorical data"""
+    def parse_llm_response(self, item_id: str, response: Dict[str, Any], file_path: str = "", prompt: str = "",
+                           fields: Optional[List[Dict[str, Any]]] = None):
+        """Parse LLM response and extract categorical data for the given fields (default: all)"""
+        if fields is None:
+            fields = self.categorical_fields
+        
         result = {
             'ID': item_id,
             'model': f"{self.provider_var.get()}_{self.model_var.get()}",
@@ -988,60 +1566,176 @@ class LLMExtractionApp:
             try:
                 # Clean and parse JSON response
                 response_text = response['response']
-                # Remove markdown code blocks if present
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
+                # Remove markdown code blocks if present (only providers without a JSON mode add them)
+                if '```' in response_text:
+                    response_text = _FENCE_RE.sub('', response_text)
                 
                 # Include raw response if save prompts is enabled
                 if self.save_prompts_var.get():
                     result['raw_llm_response'] = response['response']
                 
-                json_data = json.loads(response_text)
+                json_data = json_loads(response_text)
+                if not isinstance(json_data, dict):
+                    raise ValueError(f"Expected a JSON object, got {type(json_data).__name__}")
                 
-                # Extract each categorical field
-                for field in self.categorical_fields:
+                # Extract each categorical field, noting values outside its expected list
+                invalid = []
+                for field in fields:
                     field_name = field['name']
-                    result[field_name] = json_data.get(field_name, 'NA')
+                    value = json_data.get(field_name, 'NA')
+                    result[field_name] = value
+                    if not self.is_valid_value(field, value):
+                        invalid.append(field_name)
                 
-            except json.JSONDecodeError as e:
-                # If JSON parsing fails, mark as error and populate with NAs
+                if invalid:
+                    result['invalid_values'] = ", ".join(invalid)
+                
+            except ValueError as e:
+                # If JSON parsing fails (JSONDecodeError is a ValueError) or the
+                # response isn't an object, mark as error and populate with NAs
                 result['json_error'] = str(e)
                 result['raw_response'] = response['response']
-                for field in self.categorical_fields:
+                for field in fields:
                     result[field['name']] = f'JSON_ERROR'
         else:
             # If LLM call failed, populate with error indicators
             result['llm_error'] = response.get('response', 'Unknown error')
-            for field in self.categorical_fields:
+            for field in fields:
                 result[field['name']] = 'LLM_ERROR'
         
         return result
     
-    def save_results(self, results: List[Dict[str, Any]]):
-        """Save results to CSV file"""
-        if not results:
-            return
-        
-        df = pd.DataFrame(results)
-        
-        # Generate output filename with timestamp
+    @staticmethod
+    def is_allowed_value(value: Any, allowed: frozenset) -> bool:
+        """Check an extracted value, or each item of a list of values, against the allowed set"""
+        if isinstance(value, list):
+            return all(isinstance(item, str) and item in allowed for item in value)
+        return isinstance(value, str) and value in allowed
+    
+    @classmethod
+    def is_valid_value(cls, field: Dict[str, Any], value: Any) -> bool:
+        """Check an extracted value against the field's expected values, if it has any"""
+        return not field['allowed_values'] or cls.is_allowed_value(value, field['allowed_values'])
+    
+    def merge_results(self, result: Dict[str, Any], other: Dict[str, Any]):
+        """Merge the parsed result of another field group's request for the same item into result"""
+        for key, value in other.items():
+            if key not in result:
+                result[key] = value
+            elif key == 'processing_time':
+                result[key] += value
+            elif key == 'success':
+                result[key] = result[key] and value
+            elif key == 'invalid_values':
+                # Same ", "-separated list parse_llm_response writes for a single request
+                result[key] = f"{result[key]}, {value}"
+            elif result[key] != value:
+                # Per-request details (prompts, raw responses, errors)
+                result[key] = f"{result[key]}\n\n{value}"
+    
+    def results_output_path(self) -> str:
+        """Path of a new timestamped results CSV in the output directory"""
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         source_name = "csv" if self.source_type.get() == "csv" else "pdf"
         provider_name = self.provider_var.get()
         model_name = self.model_var.get().replace("/", "_")
         
         filename = f"extraction_results_{source_name}_{provider_name}_{model_name}_{timestamp}.csv"
-        output_path = os.path.join(self.output_dir_var.get(), filename)
-        
-        df.to_csv(output_path, index=False)
-        self.update_status(f"Results saved to: {output_path}")
+        return os.path.join(self.output_dir_var.get(), filename)
+    
+    @staticmethod
+    def prepare_resume(results_path: str, fieldnames: List[str], data_items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Set up an earlier results file to be continued.
+        
+        Items with a successful row are skipped. The failed rows of the
+        items that will be retried are removed from the file, so each ID
+        ends up with a single row once the new results are appended.
+        
+        Args:
+            results_path: Results CSV of the interrupted run
+            fieldnames: Columns of the current run
+            data_items: Items of the current run
+            
+        Returns:
+            The items still to process
+            
+        Raises:
+            ValueError: If the file was written with different columns (other fields or options)
+        """
+        with open(results_path, newline='', encoding='utf-8') as results_file:
+            reader = csv.DictReader(results_file)
+            if reader.fieldnames != fieldnames:
+                raise ValueError(f"{os.path.basename(results_path)} has different columns than this run; "
+                                 f"resume with the same fields and output options")
+            rows = list(reader)
+        
+        done_ids = {
+            row['ID'] for row in rows
+            if row['success'] == 'True' and not (row['json_error'] or row['llm_error'])
+        }
+        remaining = [item for item in data_items if item['id'] not in done_ids]
+        
+        retry_ids = {item['id'] for item in remaining}
+        kept_rows = [row for row in rows if row['ID'] not in retry_ids]
+        if len(kept_rows) < len(rows):
+            # Write to a temporary file first so an interruption can't lose the earlier results
+            temp_path = results_path + ".tmp"
+            with open(temp_path, 'w', newline='', encoding='utf-8') as temp_file:
+                writer = csv.DictWriter(temp_file, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(kept_rows)
+            os.replace(temp_path, results_path)
+        
+        return remaining
+    
+    def results_fieldnames(self) -> List[str]:
+        """Columns of the results CSV, covering every key parse_llm_response may set"""
+        fieldnames = ['ID', 'model', 'processing_time', 'success']
+        if self.source_type.get() != "csv":
+            fieldnames.append('file_path')
+        if self.save_prompts_var.get():
+            fieldnames += ['prompt_sent', 'raw_llm_response']
+        fieldnames += [field['name'] for field in self.categorical_fields]
+        fieldnames += ['invalid_values', 'json_error', 'raw_response', 'llm_error']
+        return fieldnames
     
     def update_status(self, message: str):
         """Update status label (thread-safe)"""
-        self.root.after(0, lambda: self.status_label.config(text=message))
+        with self._ui_lock:
+            self._pending_status = message
+        self._schedule_flush()
     
     def update_progress(self, value: float):
         """Update progress bar (thread-safe)"""
-        self.root.after(0, lambda: self.progress_var.set(value))
+        with self._ui_lock:
+            self._pending_progress = value
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Queue one _flush_ui call; updates made before it runs only replace the pending values"""
+        with self._ui_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.root.after(0, self._flush_ui)
+    
+    def _flush_ui(self):
+        """Apply the latest pending status and progress (runs on the Tk thread)"""
+        with self._ui_lock:
+            status, progress = self._pending_status, self._pending_progress
+            self._pending_status = self._pending_progress = None
+            self._flush_scheduled = False
+        
+        if status is not None:
+            self.status_label.config(text=status)
+        if progress is not None:
+            self.progress_var.set(progress)
+    
+    def finish_progress(self):
+        """Stop _tick from showing request counts, so later status messages stay put"""
+        with self._ui_lock:
+            self._total = 0
     
     def load_saved_settings(self):
         """Load saved settings from config"""
@@ -1119,6 +1813,8 @@ class LLMExtractionApp:
         ttk.Button(button_frame, text="Close", command=preview_window.destroy).pack(side=tk.RIGHT)
 
 if __name__ == "__main__":
+    # Required for the PDF process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = LLMExtractionApp(root)
     root.mainloop() 
\ No newline at end of file